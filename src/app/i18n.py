@@ -349,6 +349,14 @@ _T: dict[str, dict[str, str]] = {
     "prefs_theme_light":            {"en": "Light",                  "zh": "浅色"},
     "prefs_theme_dark":             {"en": "Dark",                   "zh": "深色"},
     "prefs_undo_limit":             {"en": "Max undo steps:",        "zh": "最大撤销步数:"},
+    "prefs_thumb_cache":            {"en": "Canvas thumbnail memory:", "zh": "画布缩略图内存上限:"},
+    "prefs_export_cache":           {"en": "Export image cache:",    "zh": "导出图像缓存上限:"},
+    "prefs_export_cache_tip":       {"en": "Decoded source images kept between exports so re-exporting is faster. 0 disables it.",
+                                     "zh": "在多次导出之间保留已解码的源图像以加快重复导出。0 表示禁用。"},
+    "prefs_svg_raster":             {"en": "PDF: rasterise SVGs above:", "zh": "PDF 导出栅格化 SVG 阈值:"},
+    "prefs_svg_raster_never":       {"en": "Never",                  "zh": "从不"},
+    "prefs_svg_raster_tip":         {"en": "SVGs with more elements than this are drawn into the PDF as a bitmap at export resolution instead of as vectors.",
+                                     "zh": "元素数超过此值的 SVG 在 PDF 中以导出分辨率的位图绘制，而非矢量。"},
     "prefs_mcp_autostart":          {"en": "Auto-start MCP Server on launch", "zh": "启动时自动开启 MCP 服务"},
     "prefs_mcp_autostart_tip":      {
         "en": "Enable the MCP server every time the app starts, so AI hosts can connect without you clicking the menu first.",
@@ -33,7 +33,7 @@ from src.app.about_dialog import AboutDialog, StartupUpdateChecker
 from src.app.help_dialog import HelpDialog
 from src.model.enums import PageSizePreset
 from src.export.pdf_exporter import PdfExporter
-from src.export.image_exporter import ImageExporter
+from src.export.image_exporter import ImageExporter, DEFAULT_DECODE_CACHE_MB
 from src.utils.auto_label import AutoLabel
 from src.app.commands import (
     PropertyChangeCommand, MultiPropertyChangeCommand, SwapCellsCommand, MultiSwapCellsCommand,
@@ -49,7 +49,7 @@ from src.app.commands import (
     SetExportRegionCommand, ClearExportRegionCommand,
 )
 from src.model.data_model import PiPItem
-from src.utils.image_proxy import get_image_proxy
+from src.utils.image_proxy import get_image_proxy, DEFAULT_CACHE_MB
 from src.utils.figpack import (
     BundleError, WorkingDir, cleanup_orphans, open_bundle, pack_project,
     register_pre_delete_hook,
@@ -332,6 +332,11 @@ class MainWindow(QMainWindow):
 
         # Persistent settings
         self._settings = QSettings("AcademicFigureLayout", "ImageLayoutManager")
+        get_image_proxy().set_max_cache_bytes(
+            int(self._settings.value("thumbnail_cache_mb", DEFAULT_CACHE_MB)) * 1024 * 1024)
+        ImageExporter.set_decode_cache_bytes(
+            int(self._settings.value("export_cache_mb", DEFAULT_DECODE_CACHE_MB)) * 1024 * 1024)
+        PdfExporter.set_svg_raster_threshold(int(self._settings.value("pdf_svg_raster_threshold", 0)))
 
         # Tab management — these attributes always reflect the active tab
         self._tabs: list[ProjectTabState] = []
@@ -2106,8 +2111,9 @@ class MainWindow(QMainWindow):
             self.undo_stack.push(cmd)
 
     def _on_multi_cells_swapped(self, source_ids, target_ids):
-        sources = [self.project.find_cell_by_id(sid) for sid in source_ids]
-        targets = [self.project.find_cell_by_id(tid) for tid in target_ids]
+        cells_by_id = self.project.cells_by_id()
+        sources = [cells_by_id.get(sid) for sid in source_ids]
+        targets = [cells_by_id.get(tid) for tid in target_ids]
         if all(sources) and all(targets) and len(sources) == len(targets):
             for cid in list(source_ids) + list(target_ids):
                 self.scene._cell_data_cache.pop(cid, None)
@@ -2202,7 +2208,8 @@ class MainWindow(QMainWindow):
                     "padding_right": first_cell.padding_right,
                 })
             # Common size group across selection (None if mixed or ungrouped)
-            gids = {getattr(self.project.find_cell_by_id(ci.cell_id), 'size_group_id', None)
+            cells_by_id = self.project.cells_by_id()
+            gids = {getattr(cells_by_id.get(ci.cell_id), 'size_group_id', None)
                     for ci in cell_items}
             common_gid = next(iter(gids)) if len(gids) == 1 else None
             multi_data["size_group_id"] = common_gid
@@ -2876,7 +2883,8 @@ class MainWindow(QMainWindow):
 
         menu = QMenu(self)
 
-        cells = [self.project.find_cell_by_id(cid) for cid in cell_ids]
+        cells_by_id = self.project.cells_by_id()
+        cells = [cells_by_id.get(cid) for cid in cell_ids]
         cells = [c for c in cells if c]
 
         cells_with_images = [c for c in cells if c.image_path and not c.is_placeholder]
@@ -3652,7 +3660,8 @@ class MainWindow(QMainWindow):
 
     def _on_bring_to_front(self):
         """Increment z_index of all selected cells (undoable)."""
-        cells = [self.project.find_cell_by_id(cid) for cid in self._get_selected_cell_ids()]
+        cells_by_id = self.project.cells_by_id()
+        cells = [cells_by_id.get(cid) for cid in self._get_selected_cell_ids()]
         cells = [c for c in cells if c is not None]
         if cells:
             cmd = ZIndexChangeCommand(cells, +1, self._refresh_and_update, "Bring to Front")
@@ -3660,7 +3669,8 @@ class MainWindow(QMainWindow):
 
     def _on_send_to_back(self):
         """Decrement z_index of all selected cells (undoable)."""
-        cells = [self.project.find_cell_by_id(cid) for cid in self._get_selected_cell_ids()]
+        cells_by_id = self.project.cells_by_id()
+        cells = [cells_by_id.get(cid) for cid in self._get_selected_cell_ids()]
         cells = [c for c in cells if c is not None]
         if cells:
             cmd = ZIndexChangeCommand(cells, -1, self._refresh_and_update, "Send to Back")
@@ -4626,6 +4636,7 @@ class MainWindow(QMainWindow):
     def _on_reload_images(self):
         """Clear image cache and refresh canvas to reload all images from disk."""
         get_image_proxy().clear_cache()
+        ImageExporter.clear_decode_cache()
         self._refresh_and_update()
 
     def _on_project_file_dropped(self, file_path: str):
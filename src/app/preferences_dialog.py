@@ -39,6 +39,9 @@ from PyQt6.QtWidgets import (
 
 from src.app.i18n import tr
 from src.app.theme import LIGHT, DARK
+from src.export.image_exporter import ImageExporter, DEFAULT_DECODE_CACHE_MB
+from src.export.pdf_exporter import PdfExporter
+from src.utils.image_proxy import get_image_proxy, DEFAULT_CACHE_MB
 
 
 # ──────────────────────────────────────────────────────────────────────────────
@@ -138,6 +141,33 @@ class PreferencesDialog(QDialog):
         self._undo_spin.setValue(int(self._settings.value("max_history", 200)))
         form.addRow(tr("prefs_undo_limit"), self._undo_spin)
 
+        # Thumbnail memory budget
+        self._thumb_cache_spin = QSpinBox()
+        self._thumb_cache_spin.setRange(64, 4096)
+        self._thumb_cache_spin.setSingleStep(64)
+        self._thumb_cache_spin.setSuffix(" MB")
+        self._thumb_cache_spin.setValue(get_pref("thumbnail_cache_mb", DEFAULT_CACHE_MB))
+        form.addRow(tr("prefs_thumb_cache"), self._thumb_cache_spin)
+
+        # Export decode cache budget (decoded source images kept between exports)
+        self._export_cache_spin = QSpinBox()
+        self._export_cache_spin.setRange(0, 4096)
+        self._export_cache_spin.setSingleStep(64)
+        self._export_cache_spin.setSuffix(" MB")
+        self._export_cache_spin.setToolTip(tr("prefs_export_cache_tip"))
+        self._export_cache_spin.setValue(get_pref("export_cache_mb", DEFAULT_DECODE_CACHE_MB))
+        form.addRow(tr("prefs_export_cache"), self._export_cache_spin)
+
+        # PDF export: element count above which SVGs are rasterised
+        self._svg_raster_spin = QSpinBox()
+        self._svg_raster_spin.setRange(0, 1000000)
+        self._svg_raster_spin.setSingleStep(1000)
+        self._svg_raster_spin.setSuffix(" elements")
+        self._svg_raster_spin.setSpecialValueText(tr("prefs_svg_raster_never"))
+        self._svg_raster_spin.setToolTip(tr("prefs_svg_raster_tip"))
+        self._svg_raster_spin.setValue(get_pref("pdf_svg_raster_threshold", 0))
+        form.addRow(tr("prefs_svg_raster"), self._svg_raster_spin)
+
         # MCP auto-start
         self._mcp_autostart_chk = QCheckBox(tr("prefs_mcp_autostart"))
         self._mcp_autostart_chk.setToolTip(tr("prefs_mcp_autostart_tip"))
@@ -320,6 +350,9 @@ class PreferencesDialog(QDialog):
         s.setValue("language", self._lang_combo.currentData())
         s.setValue("theme", self._theme_combo.currentData())
         s.setValue("max_history", self._undo_spin.value())
+        s.setValue("thumbnail_cache_mb", self._thumb_cache_spin.value())
+        s.setValue("export_cache_mb", self._export_cache_spin.value())
+        s.setValue("pdf_svg_raster_threshold", self._svg_raster_spin.value())
         s.setValue("mcp_autostart", self._mcp_autostart_chk.isChecked())
 
         # Files
@@ -374,6 +407,15 @@ class PreferencesDialog(QDialog):
         for tab in mw._tabs:
             tab.undo_stack.setUndoLimit(limit)
 
+        # Thumbnail and export decode memory budgets
+        get_image_proxy().set_max_cache_bytes(
+            get_pref("thumbnail_cache_mb", DEFAULT_CACHE_MB) * 1024 * 1024)
+        ImageExporter.set_decode_cache_bytes(
+            get_pref("export_cache_mb", DEFAULT_DECODE_CACHE_MB) * 1024 * 1024)
+
+        # PDF export SVG rasterisation threshold
+        PdfExporter.set_svg_raster_threshold(get_pref("pdf_svg_raster_threshold", 0))
+
         # Hot-reload enabled/disabled
         hot_reload = get_pref("hot_reload_enabled", True)
         if hasattr(mw, '_image_watcher'):
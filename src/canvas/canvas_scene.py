@@ -796,6 +796,7 @@ class CanvasScene(QGraphicsScene):
             self._divider_items.append(div)
 
         # --- Vertical dividers between columns within each row ---
+        occupied_rows = {c.row_index for c in self.project.cells}
         for row_idx, (rx, ry, rw, rh) in sorted_rows:
             row_temp = row_templates.get(row_idx)
             if row_temp is None or row_temp.column_count < 2:
@@ -803,8 +804,7 @@ class CanvasScene(QGraphicsScene):
 
             col_widths = LayoutEngine._compute_col_widths(row_temp, content_width, gap)
             # Determine actual row x start (may differ in fixed/alignment mode)
-            row_cells = [c for c in self.project.cells if c.row_index == row_idx]
-            if not row_cells:
+            if row_idx not in occupied_rows:
                 continue
 
             x_cursor = rx
@@ -5,7 +5,7 @@ from PyQt6.QtGui import QPainter, QColor, QPen, QBrush, QPixmap, QFont, QCursor
 from PyQt6.QtCore import Qt, QRectF, QRect, QPointF, pyqtSignal, QVariantAnimation, QEasingCurve, QTimer
 
 from src.model.enums import FitMode
-from src.utils.image_proxy import get_image_proxy
+from src.utils.image_proxy import get_image_proxy, VISIBLE_PRIORITY
 
 
 class ResizeHandleItem(QGraphicsRectItem):
@@ -408,6 +408,11 @@ class CropHandleItem(QGraphicsItem):
 
 
 class CellItem(QGraphicsRectItem):
+    # Scene-less text item + style option shared by every scale-bar caption
+    # paint; created on first use (needs a QApplication).
+    _caption_item = None
+    _caption_option = None
+
     def __init__(self, cell_id: str, parent=None):
         super().__init__(parent)
         self.cell_id = cell_id
@@ -1415,6 +1420,10 @@ class CellItem(QGraphicsRectItem):
         if self.is_hovered:
             painter.fillRect(rect, self.hover_brush)
 
+        if self.image_path and self._pixmap is None and not self._image_file_missing:
+            # Still loading and now on screen: move it ahead of off-screen loads
+            self.proxy.bump(self.image_path, VISIBLE_PRIORITY)
+
         # Draw image
         if self.image_path and self._image_file_missing and not self.is_placeholder:
             self._draw_missing_file_icon(painter, rect)
@@ -1843,9 +1852,13 @@ class CellItem(QGraphicsRectItem):
             base_pt = 24
             text_scale = params["text_size_mm"] / base_pt
 
-            temp_item = QGraphicsTextItem()
-            temp_item.setPlainText(text)
-            temp_item.setFont(QFont("Arial", base_pt))
+            temp_item = CellItem._caption_item
+            if temp_item is None:
+                temp_item = CellItem._caption_item = QGraphicsTextItem()
+                temp_item.setFont(QFont("Arial", base_pt))
+                CellItem._caption_option = QStyleOptionGraphicsItem()
+            if temp_item.toPlainText() != text:
+                temp_item.setPlainText(text)
             temp_item.setDefaultTextColor(QColor(params["color"]))
 
             br = temp_item.boundingRect()
@@ -1858,8 +1871,7 @@ class CellItem(QGraphicsRectItem):
             painter.save()
             painter.translate(tx, ty)
             painter.scale(text_scale, text_scale)
-            option = QStyleOptionGraphicsItem()
-            temp_item.paint(painter, option, None)
+            temp_item.paint(painter, CellItem._caption_option, None)
             painter.restore()
 
     def _draw_scale_bar(self, painter: QPainter, rect: QRectF):
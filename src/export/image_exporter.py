@@ -1,17 +1,108 @@
-from PyQt6.QtGui import QPainter, QFont, QImage, QColor
-from PyQt6.QtCore import QRectF, Qt
-from PyQt6.QtWidgets import QGraphicsTextItem, QStyleOptionGraphicsItem
+from PyQt6.QtGui import (QPainter, QFont, QImage, QImageReader, QColor, QPen, QBrush,
+                         QTextDocument, QAbstractTextDocumentLayout, QPalette)
+from PyQt6.QtCore import QRectF, QSize, Qt, QByteArray
 from PyQt6.QtSvg import QSvgRenderer
 from PIL import Image
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 import os
+import threading
 from src.model.data_model import Project, Cell
 from src.model.enums import FitMode
 from src.model.layout_engine import LayoutEngine
+from src.utils.svg_utils import sanitize_svg_bytes
+from src.utils.svg_text_utils import get_svg_override_bytes_for_cell
+
+# PyMuPDF is optional: without it PDF/EPS cells are skipped with a message.
+try:
+    import fitz
+except ImportError:
+    fitz = None
+
+
+# Scale-bar fallback calibration and display-unit -> µm factors.
+_DEFAULT_UM_PER_PX = 0.1301
+_UNIT_TO_UM = {"m": 1e6, "cm": 1e4, "dm": 1e5, "mm": 1e3, "µm": 1.0,
+               "nm": 1e-3, "pm": 1e-6, "fm": 1e-9}
+
+# Image formats Qt can decode natively; filled lazily (needs Qt plugins).
+_QT_IMAGE_FORMATS = None
+
+# Decoded source images kept across exports, so re-exporting after a small
+# edit doesn't decode every photo again: (abspath, mtime, size, shrink) ->
+# QImage (or None for undecodable files), LRU-evicted by pixel-buffer bytes.
+# The budget is the "export_cache_mb" preference (set_decode_cache_bytes),
+# separate from the canvas thumbnail budget; clear_decode_cache() drops
+# everything, e.g. on Reload Images.
+DEFAULT_DECODE_CACHE_MB = 256
+_DECODE_LRU = OrderedDict()
+_DECODE_LRU_BYTES = 0
+_DECODE_LRU_MAX_BYTES = DEFAULT_DECODE_CACHE_MB << 20
+_DECODE_LRU_LOCK = threading.Lock()
+
+# Parsed SVGs kept across exports: (abspath, mtime, override_bytes) ->
+# (QSvgRenderer, element_count), or None for invalid files. Main thread only.
+_SVG_LRU = OrderedDict()
+_SVG_LRU_MAX_ITEMS = 32
+
+# (abspath, mtime) -> native (width, height) in pixels, or None if unknown;
+# header reads shared by scale bars and decode-size planning. LRU-bounded.
+_PIXEL_SIZE_CACHE = OrderedDict()
+_PIXEL_SIZE_CACHE_MAX_ITEMS = 1024
+
+# Target strip size for compressed TIFF output (Pillow's libtiff writer).
+_TIFF_STRIP_BYTES = 1 << 20
+
+
+@lru_cache(maxsize=8)
+def _fit_mode(fit_mode_str: str) -> FitMode:
+    """Memoised ``FitMode(fit_mode_str)`` — called once per drawn image."""
+    return FitMode(fit_mode_str)
+
+
+@lru_cache(maxsize=256)
+def _ext(path: str) -> str:
+    """Memoised lower-case extension of ``path`` (one split per unique path)."""
+    return os.path.splitext(path)[1].lower()
+
+
+@lru_cache(maxsize=64)
+def _qcolor(color: str) -> QColor:
+    """Memoised ``QColor(color)``; callers must treat the result as read-only."""
+    return QColor(color)
+
+
+@lru_cache(maxsize=32)
+def _anchor_sides(anchor: str) -> tuple:
+    """Parse a text anchor such as "bottom_right_inside" into (v, h).
+
+    v is -1 top / 1 bottom / 0 centre; h is -1 left / 1 right / 0 centre.
+    """
+    v = -1 if "top" in anchor else (1 if "bottom" in anchor else 0)
+    h = -1 if "left" in anchor else (1 if "right" in anchor else 0)
+    return v, h
 
 
 class ImageExporter:
     """Export project to raster image formats (TIFF, JPG, PNG)."""
-    
+
+    # path -> decoded QImage, populated by _prefetch_images() for the duration
+    # of one _paint_scene() call.
+    _decoded: dict = {}
+    # path -> os.path.exists() result, memoised by _exists() so each unique
+    # path is stat'ed once per export instead of once per cell/PiP draw.
+    _existing: dict = {}
+    # (path, svg_override_bytes) -> QSvgRenderer (None if invalid); lets
+    # cells that show the same SVG share one parsed document.
+    _svg_renderers: dict = {}
+    # (family, weight, pt) -> QFont and (text, family, weight, color, pt,
+    # is_html) -> (QTextDocument, PaintContext, boundingRect), reset per
+    # _paint_scene() call (or PDF export) so repeated panel labels skip
+    # QFont construction and text layout.
+    _font_cache: dict = {}
+    _text_item_cache: dict = {}
+
     @staticmethod
     def export(project: Project, output_path: str, format: str = "TIFF",
                color_mode: str = "rgb", icc_profile_path: str = None,
@@ -49,8 +140,10 @@ class ImageExporter:
         height_px = int(page_h_mm * scale)
         
         # Create QImage with white background
-        # Use ARGB32 for transparency support, RGB32 for JPG
-        if format.upper() in ("JPG", "JPEG"):
+        # JPG and TIFF are always opaque: render into RGB32, which (unlike
+        # packed RGB888) keeps QPainter on its fast blend paths; the TIFF save
+        # strips the padding byte while unpacking. PNG keeps ARGB32.
+        if format.upper() in ("JPG", "JPEG", "TIFF"):
             image = QImage(width_px, height_px, QImage.Format.Format_RGB32)
             image.fill(Qt.GlobalColor.white)
         else:
@@ -73,69 +166,20 @@ class ImageExporter:
             painter.translate(-region_dx_mm * scale, -region_dy_mm * scale)
         
         try:
-            label_row_above = getattr(project, 'label_placement', 'in_cell') in ('label_row_above', 'label_row_below', 'label_col_left', 'label_col_right')
-            label_rects = getattr(layout_result, 'label_rects', {})
-
-            # 1. Draw Images and Scale Bars (sorted by z_index for freeform overlap support)
-            sorted_cells = sorted(project.get_all_leaf_cells(), key=lambda c: getattr(c, 'z_index', 0))
-            for cell in sorted_cells:
-                if cell.id not in layout_result.cell_rects:
-                    continue
-                x_mm, y_mm, w_mm, h_mm = layout_result.cell_rects[cell.id]
-
-                target_rect = QRectF(
-                    x_mm * scale, y_mm * scale, w_mm * scale, h_mm * scale
-                )
-
-                p_top = cell.padding_top * scale
-                p_right = cell.padding_right * scale
-                p_bottom = cell.padding_bottom * scale
-                p_left = cell.padding_left * scale
-                content_rect = target_rect.adjusted(p_left, p_top, -p_right, -p_bottom)
-
-                if content_rect.width() <= 0 or content_rect.height() <= 0:
-                    continue
-
-                if cell.image_path and os.path.exists(cell.image_path):
-                    rotation = getattr(cell, 'rotation', 0)
-                    crop = (getattr(cell, 'crop_left', 0.0), getattr(cell, 'crop_top', 0.0),
-                            getattr(cell, 'crop_right', 1.0), getattr(cell, 'crop_bottom', 1.0))
-                    svg_override = None
-                    if cell.image_path.lower().endswith('.svg'):
-                        from src.utils.svg_text_utils import get_svg_override_bytes_for_cell
-                        svg_override = get_svg_override_bytes_for_cell(project, cell)
-                    ImageExporter._draw_image(painter, cell.image_path, content_rect, cell.fit_mode, rotation, crop, svg_override)
-
-                    if getattr(cell, 'scale_bar_enabled', False):
-                        ImageExporter._draw_scale_bar(painter, cell, content_rect, scale)
-
-                ImageExporter._draw_pip_items(painter, project, cell, content_rect, scale)
-
-            # 1b. Draw Label Cells (label rows above picture rows)
-            if label_row_above:
-                ImageExporter._draw_label_cells(painter, project, layout_result, scale)
-                        
-            # 2. Draw Text Items
-            for text_item in project.text_items:
-                # Skip numbering labels rendered by label cells
-                if (
-                    label_row_above
-                    and text_item.scope == 'cell'
-                    and getattr(text_item, 'subtype', None) != 'corner'
-                    and text_item.parent_id in label_rects
-                ):
-                    continue
-                ImageExporter._draw_text(painter, project, text_item, layout_result, scale)
-                
+            ImageExporter._paint_scene(painter, project, layout_result, scale, fit_decode=True)
         finally:
             painter.end()
         
         # Save using appropriate format
         format_upper = format.upper()
         if format_upper == "TIFF":
-            # Use PIL for TIFF to ensure proper compression and metadata
+            # Use PIL for TIFF to ensure proper compression and metadata.
+            # Drop the Qt canvas as soon as PIL owns the pixels so the
+            # encoder / CMYK transform don't stack on top of it.
+            pil_image = ImageExporter._qimage_to_pil(image)
+            image = None
             ImageExporter._save_as_tiff(
-                image, output_path, project.dpi,
+                pil_image, output_path, project.dpi,
                 color_mode=color_mode, icc_profile_path=icc_profile_path,
                 rendering_intent=rendering_intent,
             )
@@ -148,54 +192,368 @@ class ImageExporter:
             image.save(output_path, "PNG")
     
     @staticmethod
-    def _paint_scene(painter: QPainter, project: Project, layout_result, scale: float):
+    def _paint_scene(painter: QPainter, project: Project, layout_result, scale: float,
+                     fit_decode: bool = False):
         """Shared painting logic: draws all cells, labels, and text items.
 
         Extracted so raster export, in-memory render, and SVG export can share it.
+        ``fit_decode`` lets oversized rasters be decoded at reduced size; only
+        fixed-resolution targets should set it (SVG output stays full-res).
+        It also lets cells smaller than one device pixel be skipped.
         """
         label_row_above = getattr(project, 'label_placement', 'in_cell') in (
             'label_row_above', 'label_row_below', 'label_col_left', 'label_col_right'
         )
         label_rects = getattr(layout_result, 'label_rects', {})
+        # Start from empty per-export state even if an earlier export was
+        # aborted before its own cleanup ran.
+        ImageExporter._decoded = {}
+        ImageExporter._existing = {}
+        ImageExporter._svg_renderers = {}
+        ImageExporter._font_cache.clear()
+        ImageExporter._text_item_cache.clear()
+
+        # Decode all bitmap sources up front on worker threads; the draw loop
+        # below only blits. QPainter itself must stay on this thread.
+        shrinks = (ImageExporter._fit_shrinks(project, layout_result, scale)
+                   if fit_decode else {})
+        ImageExporter._decoded = ImageExporter._prefetch_images(project, shrinks)
+        try:
+            ImageExporter._paint_cells(painter, project, layout_result, scale,
+                                       min_px=1.0 if fit_decode else 0.0)
+        finally:
+            ImageExporter._decoded = {}
+            ImageExporter._existing = {}
+            ImageExporter._svg_renderers = {}
+
+        if label_row_above:
+            ImageExporter._draw_label_cells(painter, project, layout_result, scale)
+
+        try:
+            for text_item in ImageExporter._text_items_to_draw(project, label_rects, label_row_above):
+                ImageExporter._draw_text(painter, project, text_item, layout_result, scale)
+        finally:
+            ImageExporter._text_item_cache.clear()
+
+    @staticmethod
+    def _page_bounds_mm(project: Project) -> tuple:
+        """(x0, y0, x1, y1) of the exported area in layout mm (region or page)."""
+        region = getattr(project, 'export_region', None)
+        if region is not None:
+            return (region.x_mm, region.y_mm,
+                    region.x_mm + region.w_mm, region.y_mm + region.h_mm)
+        return (0.0, 0.0, project.page_width_mm, project.page_height_mm)
 
-        sorted_cells = sorted(project.get_all_leaf_cells(), key=lambda c: getattr(c, 'z_index', 0))
+    @staticmethod
+    def _text_items_to_draw(project: Project, label_rects: dict, label_row_above: bool) -> list:
+        """project.text_items minus the numbering labels that label cells draw.
+
+        Filtered once up front so the draw loop carries no per-item checks.
+        """
+        if not label_row_above or not label_rects:
+            return project.text_items
+        return [
+            t for t in project.text_items
+            if not (t.scope == 'cell'
+                    and getattr(t, 'subtype', None) != 'corner'
+                    and t.parent_id in label_rects)
+        ]
+
+    @staticmethod
+    def _paint_cells(painter: QPainter, project: Project, layout_result, scale: float,
+                     min_px: float = 0.0):
+        """Draw cell images, scale bars and PiP insets in z_index order.
+
+        Cells narrower or shorter than ``min_px`` device units are skipped;
+        raster targets pass 1.0, vector targets (SVG user units) keep 0.0.
+        """
+        sorted_cells = sorted(project.get_all_leaf_cells(), key=lambda c: c.z_index)
+        cell_rects = layout_result.cell_rects
+        px0, py0, px1, py1 = (v * scale for v in ImageExporter._page_bounds_mm(project))
+
+        # Build the (cell, content rect) table in one pass of plain float
+        # arithmetic; the draw loop then only wraps each row in a QRectF.
+        rect_table = []
         for cell in sorted_cells:
-            if cell.id not in layout_result.cell_rects:
-                continue
-            x_mm, y_mm, w_mm, h_mm = layout_result.cell_rects[cell.id]
-            target_rect = QRectF(x_mm * scale, y_mm * scale, w_mm * scale, h_mm * scale)
-            p_top = cell.padding_top * scale
-            p_right = cell.padding_right * scale
-            p_bottom = cell.padding_bottom * scale
-            p_left = cell.padding_left * scale
-            content_rect = target_rect.adjusted(p_left, p_top, -p_right, -p_bottom)
-            if content_rect.width() <= 0 or content_rect.height() <= 0:
+            r = cell_rects.get(cell.id)
+            if r is None:
                 continue
-            if cell.image_path and os.path.exists(cell.image_path):
-                rotation = getattr(cell, 'rotation', 0)
-                crop = (getattr(cell, 'crop_left', 0.0), getattr(cell, 'crop_top', 0.0),
-                        getattr(cell, 'crop_right', 1.0), getattr(cell, 'crop_bottom', 1.0))
+            x_mm, y_mm, w_mm, h_mm = r
+            x = (x_mm + cell.padding_left) * scale
+            y = (y_mm + cell.padding_top) * scale
+            w = (w_mm - cell.padding_left - cell.padding_right) * scale
+            h = (h_mm - cell.padding_top - cell.padding_bottom) * scale
+            if w <= 0 or h <= 0 or w < min_px or h < min_px:
+                continue  # empty, or rasterises to less than one device pixel
+            if x >= px1 or y >= py1 or x + w <= px0 or y + h <= py0:
+                continue  # entirely outside the page / export region
+            rect_table.append((cell, x, y, w, h))
+
+        for cell, x, y, w, h in rect_table:
+            content_rect = QRectF(x, y, w, h)
+            if ImageExporter._exists(cell.image_path):
+                rotation = cell.rotation
+                crop = (cell.crop_left, cell.crop_top, cell.crop_right, cell.crop_bottom)
                 svg_override = None
                 if cell.image_path.lower().endswith('.svg'):
-                    from src.utils.svg_text_utils import get_svg_override_bytes_for_cell
                     svg_override = get_svg_override_bytes_for_cell(project, cell)
                 ImageExporter._draw_image(painter, cell.image_path, content_rect, cell.fit_mode, rotation, crop, svg_override)
-                if getattr(cell, 'scale_bar_enabled', False):
+                if cell.scale_bar_enabled:
                     ImageExporter._draw_scale_bar(painter, cell, content_rect, scale)
             ImageExporter._draw_pip_items(painter, project, cell, content_rect, scale)
 
-        if label_row_above:
-            ImageExporter._draw_label_cells(painter, project, layout_result, scale)
+    @staticmethod
+    def _prefetch_images(project: Project, shrinks: dict = None) -> dict:
+        """Decode every raster/PDF source the project references.
+
+        Rasters are decoded on a thread pool (Qt's readers and PIL release the
+        GIL, so multi-image figures get a real speed-up). PyMuPDF is not
+        thread-safe, so PDF/EPS pages are rendered serially on this thread.
+        Returns {path: QImage or None}; None marks a file that failed to decode
+        (already reported). Paths in ``shrinks`` are decoded at 1/shrink size
+        (see _fit_shrinks).
+        """
+        shrinks = shrinks or {}
+        paths = set()
+        for cell in project.get_all_leaf_cells():
+            if cell.image_path:
+                paths.add(cell.image_path)
+            for pip in cell.pip_items:
+                if pip.pip_type == "external" and pip.image_path:
+                    paths.add(pip.image_path)
+        paths = [p for p in paths if ImageExporter._exists(p) and not p.lower().endswith('.svg')]
+        if not paths:
+            return {}
+
+        def _decode(path):
+            try:
+                return ImageExporter._decode_image_cached(path, shrinks.get(path, 1))
+            except Exception as e:
+                print(f"Failed to export image {path}: {e}")
+                return None
+
+        rasters = [p for p in paths if _ext(p) not in ('.pdf', '.eps')]
+        decoded = {p: _decode(p) for p in paths if _ext(p) in ('.pdf', '.eps')}
+        if rasters:
+            workers = min(len(rasters), os.cpu_count() or 4)
+            with ThreadPoolExecutor(max_workers=workers) as pool:
+                decoded.update(zip(rasters, pool.map(_decode, rasters)))
+        return decoded
 
-        for text_item in project.text_items:
-            if (
-                label_row_above
-                and text_item.scope == 'cell'
-                and getattr(text_item, 'subtype', None) != 'corner'
-                and text_item.parent_id in label_rects
-            ):
+    @staticmethod
+    def _fit_shrinks(project: Project, layout_result, scale: float) -> dict:
+        """Per-path decode reduction for sources far larger than their cells.
+
+        A path shown in several cells gets the smallest reduction any of them
+        needs; paths a zoom or external PiP magnifies are always full-size.
+        """
+        full_res = set()
+        shrinks = {}
+        cell_rects = layout_result.cell_rects
+        for cell in project.get_all_leaf_cells():
+            for pip in cell.pip_items:
+                full_res.add(cell.image_path if pip.pip_type == "zoom" else pip.image_path)
+            path = cell.image_path
+            r = cell_rects.get(cell.id)
+            if not path or r is None or path.lower().endswith(('.svg', '.pdf', '.eps')):
+                continue
+            w = (r[2] - cell.padding_left - cell.padding_right) * scale
+            h = (r[3] - cell.padding_top - cell.padding_bottom) * scale
+            if w < 1 or h < 1 or not ImageExporter._exists(path):
                 continue
-            ImageExporter._draw_text(painter, project, text_item, layout_result, scale)
+            crop = (cell.crop_left, cell.crop_top, cell.crop_right, cell.crop_bottom)
+            shrink = ImageExporter._decode_shrink(path, QRectF(0, 0, w, h), cell.fit_mode, cell.rotation, crop)
+            shrinks[path] = min(shrinks.get(path, shrink), shrink)
+        return {p: s for p, s in shrinks.items() if s > 1 and p not in full_res}
+
+    @staticmethod
+    def _decode_shrink(path: str, rect: QRectF, fit_mode_str: str, rotation: int, crop: tuple) -> int:
+        """Largest power-of-two decode reduction that still covers ``rect``.
+
+        A 24 MP photo in a 40 mm panel only needs a few hundred dots; decoding
+        it at 1/2, 1/4 or 1/8 size saves decode time and memory while keeping
+        at least one source pixel per output dot.
+        """
+        native = ImageExporter._pixel_size(path)
+        if native is None:
+            return 1
+        cl, ct, cr, cb = crop
+        vis_w = native[0] * max(0.001, cr - cl)
+        vis_h = native[1] * max(0.001, cb - ct)
+        if rotation in (90, 270):
+            vis_w, vis_h = vis_h, vis_w
+        if _fit_mode(fit_mode_str) == FitMode.COVER:
+            ratio = max(rect.width() / vis_w, rect.height() / vis_h)
+        else:
+            ratio = min(rect.width() / vis_w, rect.height() / vis_h)
+        shrink = 1
+        while ratio * shrink * 2 <= 1.0 and shrink < 8:
+            shrink *= 2
+        return shrink
+
+    @staticmethod
+    def _exists(path: str) -> bool:
+        """``os.path.exists`` answered from the per-export stat pass when possible."""
+        if not path:
+            return False
+        ok = ImageExporter._existing.get(path)
+        if ok is None:
+            ok = ImageExporter._existing[path] = os.path.exists(path)
+        return ok
+
+    @staticmethod
+    def _decode_image(path: str, shrink: int = 1) -> QImage:
+        """Decode a raster or PDF/EPS (first page) file into a standalone QImage.
+
+        ``shrink`` > 1 decodes rasters at 1/shrink of their native size (JPEG
+        uses libjpeg's DCT scaling, so the full image is never materialised).
+        """
+        ext = _ext(path)
+        if ext in ('.pdf', '.eps'):
+            if fitz is None:
+                raise ImportError("PyMuPDF not installed")
+            doc = fitz.open(path)
+            try:
+                if doc.page_count == 0:
+                    return None
+                # Render at high resolution for quality
+                zoom = 4.0  # 4x zoom for high quality
+                pix = doc[0].get_pixmap(matrix=fitz.Matrix(zoom, zoom), alpha=True)
+            finally:
+                doc.close()
+            # pix.samples is already a fresh bytes object; the QImage wraps it
+            # in place (PyQt holds the reference) instead of copying it again.
+            return QImage(pix.samples, pix.width, pix.height, pix.stride, QImage.Format.Format_RGBA8888)
+
+        if ext.lstrip('.') in ImageExporter._qt_image_formats():
+            # Qt's own decoders (libjpeg/libpng) produce the QImage directly in
+            # its native format -- no PIL decode, RGBA promotion or bytes copy.
+            # EXIF orientation is left alone, matching the PIL path and canvas.
+            reader = QImageReader(path)
+            reader.setAutoTransform(False)
+            if shrink > 1:
+                native = reader.size()
+                if native.isValid():
+                    reader.setScaledSize(QSize(max(1, native.width() // shrink),
+                                               max(1, native.height() // shrink)))
+            qimage = reader.read()
+            if not qimage.isNull():
+                return qimage
+
+        # Formats Qt can't read (or failed on): decode with PIL.
+        with Image.open(path) as img:
+            if shrink > 1:
+                target = (max(1, img.width // shrink), max(1, img.height // shrink))
+                img.draft(img.mode, target)  # JPEG: DCT-domain scaling; no-op otherwise
+                factor = img.width // target[0]
+                if factor > 1:
+                    img = img.reduce(factor)
+            # Keep the source's native layout where Qt has a matching format;
+            # only images that can carry alpha are widened to RGBA.
+            if img.mode == 'CMYK':
+                img = img.convert('RGB')
+            elif img.mode == '1':
+                img = img.convert('L')
+            elif img.mode == 'P' and 'transparency' not in img.info:
+                img = img.convert('RGB')
+            elif img.mode in ('RGBA', 'LA') and img.getchannel('A').getextrema()[0] == 255:
+                # Fully opaque alpha channel: drop it (3 or 1 bytes/px, not 4).
+                img = img.convert('RGB' if img.mode == 'RGBA' else 'L')
+            if img.mode == 'RGB':
+                fmt, bpp = QImage.Format.Format_RGB888, 3
+            elif img.mode == 'L':
+                fmt, bpp = QImage.Format.Format_Grayscale8, 1
+            else:
+                if img.mode != 'RGBA':
+                    img = img.convert('RGBA')
+                fmt, bpp = QImage.Format.Format_RGBA8888, 4
+            # tobytes() is the one unavoidable copy out of PIL's tiled storage.
+            # PyQt keeps ``data`` alive for the QImage's lifetime, so wrap it
+            # directly rather than paying for a second full-size .copy().
+            data = img.tobytes()
+            return QImage(data, img.width, img.height, img.width * bpp, fmt)
+
+    @staticmethod
+    def _qt_image_formats() -> set:
+        """Lower-case extensions QImageReader can decode (queried once)."""
+        global _QT_IMAGE_FORMATS
+        if _QT_IMAGE_FORMATS is None:
+            _QT_IMAGE_FORMATS = {bytes(f).decode().lower()
+                                 for f in QImageReader.supportedImageFormats()}
+        return _QT_IMAGE_FORMATS
+
+    @staticmethod
+    def _cached_image(path: str) -> QImage:
+        """Return the prefetched QImage for ``path``, decoding it on a miss."""
+        if path in ImageExporter._decoded:
+            return ImageExporter._decoded[path]
+        return ImageExporter._decode_image_cached(path)
+
+    @staticmethod
+    def set_decode_cache_bytes(max_bytes: int) -> None:
+        """Set the decode cache's memory budget, evicting down to it now."""
+        global _DECODE_LRU_MAX_BYTES, _DECODE_LRU_BYTES
+        with _DECODE_LRU_LOCK:
+            _DECODE_LRU_MAX_BYTES = max(0, int(max_bytes))
+            while _DECODE_LRU and _DECODE_LRU_BYTES > _DECODE_LRU_MAX_BYTES:
+                _, old = _DECODE_LRU.popitem(last=False)
+                _DECODE_LRU_BYTES -= old.sizeInBytes() if old is not None else 0
+
+    @staticmethod
+    def clear_decode_cache() -> None:
+        """Release every decoded image kept across exports."""
+        global _DECODE_LRU_BYTES
+        with _DECODE_LRU_LOCK:
+            _DECODE_LRU.clear()
+            _DECODE_LRU_BYTES = 0
+
+    @staticmethod
+    def _decode_image_cached(path: str, shrink: int = 1) -> QImage:
+        """``_decode_image`` memoised across exports (see _DECODE_LRU).
+
+        The key includes the file's mtime and size, so an edited file is
+        decoded afresh. Safe to call from the prefetch worker threads.
+        """
+        global _DECODE_LRU_BYTES
+        st = os.stat(path)
+        key = (os.path.abspath(path), st.st_mtime, st.st_size, shrink)
+        with _DECODE_LRU_LOCK:
+            if key in _DECODE_LRU:
+                _DECODE_LRU.move_to_end(key)
+                return _DECODE_LRU[key]
+        qimage = ImageExporter._decode_image(path, shrink)
+        nbytes = qimage.sizeInBytes() if qimage is not None else 0
+        if _DECODE_LRU_MAX_BYTES <= 0 or nbytes > _DECODE_LRU_MAX_BYTES:
+            return qimage
+        with _DECODE_LRU_LOCK:
+            if key not in _DECODE_LRU:
+                _DECODE_LRU[key] = qimage
+                _DECODE_LRU_BYTES += nbytes
+                while _DECODE_LRU_BYTES > _DECODE_LRU_MAX_BYTES:
+                    _, old = _DECODE_LRU.popitem(last=False)
+                    _DECODE_LRU_BYTES -= old.sizeInBytes() if old is not None else 0
+        return qimage
+
+    @staticmethod
+    def _compute_target_rect(rect: QRectF, img_w: float, img_h: float, fit_mode_str: str,
+                             rotation: int = 0):
+        """Fit an (unrotated) img_w x img_h image into ``rect``.
+
+        Returns (target_rect, ratio): the centred on-page rect of the rotated
+        image and the source->output scale. CONTAIN uses the smaller ratio,
+        COVER the larger one (caller clips to ``rect``).
+        """
+        if rotation in (90, 270):
+            img_w, img_h = img_h, img_w
+        if _fit_mode(fit_mode_str) == FitMode.CONTAIN:
+            ratio = min(rect.width() / img_w, rect.height() / img_h)
+        else:
+            ratio = max(rect.width() / img_w, rect.height() / img_h)
+        new_w = img_w * ratio
+        new_h = img_h * ratio
+        x = rect.left() + (rect.width() - new_w) / 2
+        y = rect.top() + (rect.height() - new_h) / 2
+        return QRectF(x, y, new_w, new_h), ratio
 
     @staticmethod
     def render_to_qimage(project: Project) -> QImage:
@@ -223,7 +581,10 @@ class ImageExporter:
         width_px = int(page_w_mm * scale)
         height_px = int(page_h_mm * scale)
 
-        image = QImage(width_px, height_px, QImage.Format.Format_ARGB32)
+        # The page is painted over opaque white, so the result never needs an
+        # alpha channel; RGB32 spares callers an alpha strip/composite pass
+        # when they scale or encode it (e.g. the JPEG preview in figpack).
+        image = QImage(width_px, height_px, QImage.Format.Format_RGB32)
         image.fill(Qt.GlobalColor.white)
 
         dpm = int(project.dpi * 39.3701)
@@ -239,7 +600,7 @@ class ImageExporter:
             painter.translate(-region_dx_mm * scale, -region_dy_mm * scale)
 
         try:
-            ImageExporter._paint_scene(painter, project, layout_result, scale)
+            ImageExporter._paint_scene(painter, project, layout_result, scale, fit_decode=True)
         finally:
             painter.end()
 
@@ -248,7 +609,7 @@ class ImageExporter:
     @staticmethod
     def _draw_pip_items(painter: QPainter, project, cell, content_rect: QRectF, scale: float):
         """Draw all PiP insets for a cell onto the given content_rect."""
-        pip_items = getattr(cell, 'pip_items', [])
+        pip_items = cell.pip_items
         if not pip_items:
             return
         cw = content_rect.width()
@@ -265,10 +626,10 @@ class ImageExporter:
             painter.save()
             painter.setClipRect(img_rect)
             # Draw pip image
-            if pip.pip_type == "zoom" and cell.image_path and os.path.exists(cell.image_path):
+            if pip.pip_type == "zoom" and ImageExporter._exists(cell.image_path):
                 src_crop = (pip.crop_left, pip.crop_top, pip.crop_right, pip.crop_bottom)
                 ImageExporter._draw_raster(painter, cell.image_path, img_rect, "contain", 0, src_crop)
-            elif pip.pip_type == "external" and pip.image_path and os.path.exists(pip.image_path):
+            elif pip.pip_type == "external" and ImageExporter._exists(pip.image_path):
                 ImageExporter._draw_image(painter, pip.image_path, img_rect, "contain", 0)
             painter.restore()
 
@@ -277,7 +638,7 @@ class ImageExporter:
                 # Determine correct mapping inheritance
                 current_um_per_px = getattr(pip, "scale_bar_um_per_px", 0.0)
                 if pip.pip_type == "zoom" and current_um_per_px <= 0:
-                    current_um_per_px = getattr(cell, "scale_bar_um_per_px", 0.1301)
+                    current_um_per_px = cell.scale_bar_um_per_px
                 if current_um_per_px <= 0:
                     current_um_per_px = 0.1301
                 
@@ -293,8 +654,7 @@ class ImageExporter:
                 pip.scale_bar_um_per_px = old_um
             # Draw border
             if pip.border_enabled:
-                from PyQt6.QtGui import QPen
-                bpen = QPen(QColor(pip.border_color))
+                bpen = QPen(_qcolor(pip.border_color))
                 # pt -> output units: pt * mm/pt * units/mm = pt * 25.4/72 * scale
                 bpen.setWidthF(pip.border_width_pt * (scale * 25.4 / 72.0))
                 bpen.setCosmetic(False)
@@ -311,8 +671,7 @@ class ImageExporter:
                     (pip.crop_right - pip.crop_left) * cw,
                     (pip.crop_bottom - pip.crop_top) * ch,
                 )
-                from PyQt6.QtGui import QPen
-                open_pen = QPen(QColor(pip.origin_box_color))
+                open_pen = QPen(_qcolor(pip.origin_box_color))
                 # pt -> output units (see _draw_pip_items border comment above)
                 open_pen.setWidthF(pip.origin_box_width_pt * (scale * 25.4 / 72.0))
                 open_pen.setCosmetic(False)
@@ -323,10 +682,30 @@ class ImageExporter:
                 painter.drawRect(origin_rect)
 
     @staticmethod
-    def _save_as_tiff(qimage: QImage, output_path: str, dpi: int,
+    def _qimage_to_pil(qimage: QImage):
+        """Copy a QImage's pixels into a PIL image (RGB, or RGBA for ARGB32)."""
+        width = qimage.width()
+        height = qimage.height()
+        # constBits(): bits() is the mutable accessor and deep-copies the
+        # whole buffer if the QImage is shared. We only read here.
+        ptr = qimage.constBits()
+        ptr.setsize(qimage.sizeInBytes())
+        # Hand PIL a read-only view of the Qt pixel buffer instead of a
+        # bytes() copy; every branch below unpacks into PIL-owned memory.
+        buf = memoryview(ptr)
+
+        fmt = qimage.format()
+        stride = qimage.bytesPerLine()
+        if fmt == QImage.Format.Format_ARGB32:
+            return Image.frombuffer("RGBA", (width, height), buf, "raw", "BGRA", stride, 1)
+        # Opaque 32-bit: drop the padding byte while unpacking.
+        return Image.frombuffer("RGB", (width, height), buf, "raw", "BGRX", stride, 1)
+
+    @staticmethod
+    def _save_as_tiff(pil_image, output_path: str, dpi: int,
                       color_mode: str = "rgb", icc_profile_path: str = None,
                       rendering_intent: int = 1):
-        """Save QImage as TIFF with proper DPI metadata using PIL.
+        """Save a PIL image (see ``_qimage_to_pil``) as TIFF with proper DPI metadata.
 
         color_mode: "rgb" (default) or "cmyk" for print-ready output.
         icc_profile_path: absolute path to a CMYK ICC profile (*.icc/*.icm).
@@ -336,18 +715,12 @@ class ImageExporter:
             load, falls back to Pillow's naive ``convert('CMYK')`` and logs a
             warning.
         """
-        width = qimage.width()
-        height = qimage.height()
-        ptr = qimage.bits()
-        ptr.setsize(qimage.sizeInBytes())
-
-        if qimage.format() == QImage.Format.Format_ARGB32:
-            pil_image = Image.frombytes("RGBA", (width, height), bytes(ptr), "raw", "BGRA")
-        else:
-            pil_image = Image.frombytes("RGBA", (width, height), bytes(ptr), "raw", "BGRA")
-            pil_image = pil_image.convert("RGB")
-
-        save_kwargs = {"dpi": (dpi, dpi), "compression": "tiff_lzw"}
+        # libtiff writes 64 KB strips by default, i.e. thousands of tiny
+        # strips (and writes) for a poster-size export. Ask for ~1 MB strips.
+        # Deflate (compression tag 8) compresses faster and smaller than LZW
+        # and, unlike zstd, opens in every TIFF reader journals use.
+        save_kwargs = {"dpi": (dpi, dpi), "compression": "tiff_adobe_deflate",
+                       "strip_size": _TIFF_STRIP_BYTES}
 
         if str(color_mode).lower() == "cmyk":
             if pil_image.mode != "RGB":
@@ -358,7 +731,13 @@ class ImageExporter:
             if profile_bytes:
                 save_kwargs["icc_profile"] = profile_bytes
 
-        pil_image.save(output_path, "TIFF", **save_kwargs)
+        try:
+            pil_image.save(output_path, "TIFF", **save_kwargs)
+        except (OSError, KeyError) as exc:
+            # libtiff built without zlib: fall back to the always-present LZW.
+            print(f"[tiff-export] Deflate unavailable ({exc!r}); saving with LZW.")
+            save_kwargs["compression"] = "tiff_lzw"
+            pil_image.save(output_path, "TIFF", **save_kwargs)
 
     @staticmethod
     def _convert_rgb_to_cmyk(pil_rgb, icc_profile_path: str = None,
@@ -369,7 +748,6 @@ class ImageExporter:
         supplied or discoverable on the system.  Falls back to ``convert('CMYK')``
         with a printed warning when no usable profile is found.
         """
-        import os
         from PIL import ImageCms
 
         # 1. Resolve a CMYK output profile.
@@ -472,7 +850,7 @@ class ImageExporter:
     def _draw_image(painter: QPainter, path: str, rect: QRectF, fit_mode_str: str, rotation: int = 0,
                     crop: tuple = (0.0, 0.0, 1.0, 1.0), svg_override_bytes: bytes = None):
         """Draw an image into the given rect, applying crop and rotation."""
-        ext = os.path.splitext(path)[1].lower()
+        ext = _ext(path)
         if ext == '.svg':
             ImageExporter._draw_svg(painter, path, rect, fit_mode_str, rotation, crop, svg_override_bytes)
         elif ext in ('.pdf', '.eps'):
@@ -480,24 +858,49 @@ class ImageExporter:
         else:
             ImageExporter._draw_raster(painter, path, rect, fit_mode_str, rotation, crop)
 
+    @staticmethod
+    def _load_svg(path: str, svg_override_bytes: bytes = None):
+        """Parse an SVG (or its text-override bytes) once across exports.
+
+        Returns (QSvgRenderer, element_count), or None if the SVG is invalid.
+        Keyed by mtime so an edited file is re-parsed.
+        """
+        key = (os.path.abspath(path), os.path.getmtime(path), svg_override_bytes)
+        if key in _SVG_LRU:
+            _SVG_LRU.move_to_end(key)
+            return _SVG_LRU[key]
+        if svg_override_bytes:
+            svg_bytes = sanitize_svg_bytes(svg_override_bytes)
+        else:
+            with open(path, "rb") as _f:
+                svg_bytes = sanitize_svg_bytes(_f.read())
+        renderer = QSvgRenderer(QByteArray(svg_bytes))
+        if renderer.isValid():
+            # Cheap element count: opening tags minus closing tags.
+            loaded = (renderer, svg_bytes.count(b'<') - svg_bytes.count(b'</'))
+        else:
+            print(f"Invalid SVG file: {path}")
+            loaded = None
+        _SVG_LRU[key] = loaded
+        if len(_SVG_LRU) > _SVG_LRU_MAX_ITEMS:
+            _SVG_LRU.popitem(last=False)
+        return loaded
+
     @staticmethod
     def _draw_svg(painter: QPainter, path: str, rect: QRectF, fit_mode_str: str, rotation: int = 0,
                   crop: tuple = (0.0, 0.0, 1.0, 1.0), svg_override_bytes: bytes = None):
         """Draw SVG vector image, honouring crop."""
         try:
-            from PyQt6.QtCore import QByteArray
-            from src.utils.svg_utils import sanitize_svg_bytes
-            if svg_override_bytes:
-                svg_bytes = sanitize_svg_bytes(svg_override_bytes)
+            key = (path, svg_override_bytes)
+            if key in ImageExporter._svg_renderers:
+                renderer = ImageExporter._svg_renderers[key]
             else:
-                with open(path, "rb") as _f:
-                    svg_bytes = sanitize_svg_bytes(_f.read())
-            renderer = QSvgRenderer(QByteArray(svg_bytes))
-            if not renderer.isValid():
-                print(f"Invalid SVG file: {path}")
+                loaded = ImageExporter._load_svg(path, svg_override_bytes)
+                renderer = loaded[0] if loaded is not None else None
+                ImageExporter._svg_renderers[key] = renderer
+            if renderer is None:
                 return
 
-            fit_mode = FitMode(fit_mode_str)
             default_size = renderer.defaultSize()
             img_w = default_size.width() if not default_size.isEmpty() else rect.width()
             img_h = default_size.height() if not default_size.isEmpty() else rect.height()
@@ -505,42 +908,30 @@ class ImageExporter:
             cl, ct, cr, cb = crop
             crop_w_frac = max(0.001, cr - cl)
             crop_h_frac = max(0.001, cb - ct)
-            eff_img_w_full = img_w
-            eff_img_h_full = img_h
-
-            # Effective dimensions are the cropped portion
-            is_sideways = rotation in [90, 270]
-            eff_crop_w = (img_h * crop_h_frac) if is_sideways else (img_w * crop_w_frac)
-            eff_crop_h = (img_w * crop_w_frac) if is_sideways else (img_h * crop_h_frac)
 
-            if fit_mode == FitMode.CONTAIN:
-                ratio = min(rect.width() / eff_crop_w, rect.height() / eff_crop_h)
-            else:
-                ratio = max(rect.width() / eff_crop_w, rect.height() / eff_crop_h)
-
-            # Where the crop portion lands (centred in rect)
-            crop_canvas_w = eff_crop_w * ratio
-            crop_canvas_h = eff_crop_h * ratio
-            crop_x = rect.left() + (rect.width() - crop_canvas_w) / 2
-            crop_y = rect.top() + (rect.height() - crop_canvas_h) / 2
+            # Fit the cropped portion; it lands centred in rect
+            crop_rect, ratio = ImageExporter._compute_target_rect(
+                rect, img_w * crop_w_frac, img_h * crop_h_frac, fit_mode_str, rotation)
 
             # Full SVG canvas rect (may extend beyond rect edges)
-            full_w = eff_img_w_full * ratio
-            full_h = eff_img_h_full * ratio
-            full_x = crop_x - cl * full_w
-            full_y = crop_y - ct * full_h
-            target_rect = QRectF(full_x, full_y, full_w, full_h)
+            full_w = img_w * ratio
+            full_h = img_h * ratio
+            target_rect = QRectF(crop_rect.x() - cl * full_w, crop_rect.y() - ct * full_h,
+                                 full_w, full_h)
+
+            if rotation == 0 and crop_rect == target_rect:
+                # Uncropped and unrotated: the crop clip would be a no-op.
+                renderer.render(painter, target_rect)
+                return
 
             painter.save()
             # Always clip to the visible crop area
-            painter.setClipRect(QRectF(crop_x, crop_y, crop_canvas_w, crop_canvas_h))
+            painter.setClipRect(crop_rect)
 
             if rotation != 0:
-                center = QRectF(crop_x, crop_y, crop_canvas_w, crop_canvas_h).center()
-                painter.translate(center)
+                painter.translate(crop_rect.center())
                 painter.rotate(rotation)
-                draw_rect = QRectF(-eff_img_w_full * ratio / 2, -eff_img_h_full * ratio / 2,
-                                   eff_img_w_full * ratio, eff_img_h_full * ratio)
+                draw_rect = QRectF(-full_w / 2, -full_h / 2, full_w, full_h)
                 renderer.render(painter, draw_rect)
             else:
                 renderer.render(painter, target_rect)
@@ -553,82 +944,66 @@ class ImageExporter:
     @staticmethod
     def _draw_raster(painter: QPainter, path: str, rect: QRectF, fit_mode_str: str, rotation: int = 0,
                      crop: tuple = (0.0, 0.0, 1.0, 1.0)):
-        """Draw raster image using PIL, honouring crop."""
+        """Draw raster image (decoded via PIL), honouring crop."""
         try:
-            with Image.open(path) as img:
-                if img.mode != 'RGBA':
-                    img = img.convert('RGBA')
+            qimage = ImageExporter._cached_image(path)
+            if qimage is None:
+                return
+
+            cl, ct, cr, cb = crop
+            full_w, full_h = qimage.width(), qimage.height()
+            # Crop to the visible region in source pixels
+            cx0 = int(cl * full_w)
+            cy0 = int(ct * full_h)
+            cx1 = max(cx0 + 1, int(cr * full_w))
+            cy1 = max(cy0 + 1, int(cb * full_h))
+            if cx0 != 0 or cy0 != 0 or cx1 != full_w or cy1 != full_h:
+                qimage = qimage.copy(cx0, cy0, cx1 - cx0, cy1 - cy0)
+
+            img_w = qimage.width()
+            img_h = qimage.height()
+            target_rect, ratio = ImageExporter._compute_target_rect(
+                rect, img_w, img_h, fit_mode_str, rotation)
 
-                cl, ct, cr, cb = crop
-                full_w, full_h = img.width, img.height
-                # Crop to the visible region in source pixels
-                cx0 = int(cl * full_w)
-                cy0 = int(ct * full_h)
-                cx1 = max(cx0 + 1, int(cr * full_w))
-                cy1 = max(cy0 + 1, int(cb * full_h))
-                if cx0 != 0 or cy0 != 0 or cx1 != full_w or cy1 != full_h:
-                    img = img.crop((cx0, cy0, cx1, cy1))
-
-                data = img.tobytes("raw", "RGBA")
-                qimage = QImage(data, img.width, img.height, QImage.Format.Format_RGBA8888)
-
-                fit_mode = FitMode(fit_mode_str)
-                img_w = qimage.width()
-                img_h = qimage.height()
-
-                is_sideways = rotation in [90, 270]
-                eff_img_w = img_h if is_sideways else img_w
-                eff_img_h = img_w if is_sideways else img_h
-
-                if fit_mode == FitMode.CONTAIN:
-                    ratio = min(rect.width() / eff_img_w, rect.height() / eff_img_h)
-                else:
-                    ratio = max(rect.width() / eff_img_w, rect.height() / eff_img_h)
-
-                new_w = eff_img_w * ratio
-                new_h = eff_img_h * ratio
-                x = rect.left() + (rect.width() - new_w) / 2
-                y = rect.top() + (rect.height() - new_h) / 2
-                target_rect = QRectF(x, y, new_w, new_h)
-
-                painter.save()
-                if fit_mode == FitMode.COVER:
-                    painter.setClipRect(rect)
-                painter.setRenderHint(QPainter.RenderHint.SmoothPixmapTransform)
-                if rotation != 0:
-                    painter.translate(target_rect.center())
-                    painter.rotate(rotation)
-                    draw_rect = QRectF(-img_w * ratio / 2, -img_h * ratio / 2, img_w * ratio, img_h * ratio)
-                    painter.drawImage(draw_rect, qimage)
-                else:
-                    painter.drawImage(target_rect, qimage)
-                painter.restore()
+            ImageExporter._blit(painter, qimage, rect, target_rect, ratio, fit_mode_str, rotation)
 
         except Exception as e:
             print(f"Failed to export image {path}: {e}")
 
+    @staticmethod
+    def _blit(painter: QPainter, qimage: QImage, rect: QRectF, target_rect: QRectF,
+              ratio: float, fit_mode_str: str, rotation: int = 0):
+        """Draw a fitted bitmap; ``target_rect``/``ratio`` from _compute_target_rect."""
+        cover = _fit_mode(fit_mode_str) == FitMode.COVER
+        if rotation == 0 and not cover:
+            # Common case: nothing to clip or transform, so skip the painter
+            # state push/pop. Callers' painters already enable smooth scaling.
+            painter.drawImage(target_rect, qimage)
+            return
+
+        painter.save()
+        if cover:
+            painter.setClipRect(rect)
+        painter.setRenderHint(QPainter.RenderHint.SmoothPixmapTransform)
+        if rotation != 0:
+            img_w = qimage.width()
+            img_h = qimage.height()
+            painter.translate(target_rect.center())
+            painter.rotate(rotation)
+            draw_rect = QRectF(-img_w * ratio / 2, -img_h * ratio / 2, img_w * ratio, img_h * ratio)
+            painter.drawImage(draw_rect, qimage)
+        else:
+            painter.drawImage(target_rect, qimage)
+        painter.restore()
+
     @staticmethod
     def _draw_pdf(painter: QPainter, path: str, rect: QRectF, fit_mode_str: str, rotation: int = 0,
                   crop: tuple = (0.0, 0.0, 1.0, 1.0)):
         """Draw PDF first page as raster image using PyMuPDF."""
         try:
-            import fitz  # PyMuPDF
-            
-            doc = fitz.open(path)
-            if doc.page_count == 0:
-                doc.close()
+            qimage = ImageExporter._cached_image(path)
+            if qimage is None:
                 return
-            
-            page = doc[0]
-            
-            # Render at high resolution for quality
-            zoom = 4.0  # 4x zoom for high quality
-            matrix = fitz.Matrix(zoom, zoom)
-            pix = page.get_pixmap(matrix=matrix, alpha=True)
-            doc.close()
-            
-            # Convert to QImage
-            qimage = QImage(pix.samples, pix.width, pix.height, pix.stride, QImage.Format.Format_RGBA8888).copy()
 
             # Apply crop by sub-imaging the QImage
             cl, ct, cr, cb = crop
@@ -641,37 +1016,12 @@ class ImageExporter:
             if cx0 != 0 or cy0 != 0 or cx1 != img_w_full or cy1 != img_h_full:
                 qimage = qimage.copy(cx0, cy0, cx1 - cx0, cy1 - cy0)
 
-            fit_mode = FitMode(fit_mode_str)
             img_w = qimage.width()
             img_h = qimage.height()
+            target_rect, ratio = ImageExporter._compute_target_rect(
+                rect, img_w, img_h, fit_mode_str, rotation)
 
-            is_sideways = rotation in [90, 270]
-            eff_img_w = img_h if is_sideways else img_w
-            eff_img_h = img_w if is_sideways else img_h
-
-            if fit_mode == FitMode.CONTAIN:
-                ratio = min(rect.width() / eff_img_w, rect.height() / eff_img_h)
-            else:
-                ratio = max(rect.width() / eff_img_w, rect.height() / eff_img_h)
-
-            new_w = eff_img_w * ratio
-            new_h = eff_img_h * ratio
-            x = rect.left() + (rect.width() - new_w) / 2
-            y = rect.top() + (rect.height() - new_h) / 2
-            target_rect = QRectF(x, y, new_w, new_h)
-
-            painter.save()
-            if fit_mode == FitMode.COVER:
-                painter.setClipRect(rect)
-            painter.setRenderHint(QPainter.RenderHint.SmoothPixmapTransform)
-            if rotation != 0:
-                painter.translate(target_rect.center())
-                painter.rotate(rotation)
-                draw_rect = QRectF(-img_w * ratio / 2, -img_h * ratio / 2, img_w * ratio, img_h * ratio)
-                painter.drawImage(draw_rect, qimage)
-            else:
-                painter.drawImage(target_rect, qimage)
-            painter.restore()
+            ImageExporter._blit(painter, qimage, rect, target_rect, ratio, fit_mode_str, rotation)
 
         except Exception as e:
             print(f"Failed to export PDF {path}: {e}")
@@ -705,17 +1055,12 @@ class ImageExporter:
         base_pt = 24
         text_scale = text_item.font_size_pt / base_pt
 
-        # Create temporary QGraphicsTextItem - same as canvas does
-        temp_item = QGraphicsTextItem()
-        temp_item.setHtml(text_item.text)
+        # Same layout as the canvas QGraphicsTextItem; identical text bodies
+        # (e.g. repeated panel labels) reuse the laid-out document.
+        doc, ctx, base_rect = ImageExporter._text_doc(
+            text_item.text, text_item.font_family, text_item.font_weight, text_item.color,
+            base_pt, html=not ImageExporter._is_plain_text(text_item.text))
 
-        font = QFont(text_item.font_family, base_pt)
-        if text_item.font_weight == "bold":
-            font.setBold(True)
-        temp_item.setFont(font)
-        temp_item.setDefaultTextColor(QColor(text_item.color))
-
-        base_rect = temp_item.boundingRect()
         tw_mm = base_rect.width() * text_scale
         th_mm = base_rect.height() * text_scale
 
@@ -743,34 +1088,79 @@ class ImageExporter:
             painter.rotate(rotation_deg)
             painter.translate(-tw_mm * scale / 2.0, -th_mm * scale / 2.0)
         if getattr(text_item, 'bg_enabled', False):
-            from PyQt6.QtGui import QBrush as _QB
             pad = float(getattr(text_item, 'bg_padding_mm', 0.6)) * scale
             painter.save()
             painter.setPen(Qt.PenStyle.NoPen)
-            painter.setBrush(_QB(QColor(getattr(text_item, 'bg_color', '#FFFFFF'))))
+            painter.setBrush(QBrush(_qcolor(getattr(text_item, 'bg_color', '#FFFFFF'))))
             painter.drawRect(QRectF(-pad, -pad, tw_mm * scale + 2 * pad, th_mm * scale + 2 * pad))
             painter.restore()
         painter.scale(render_scale, render_scale)
-        option = QStyleOptionGraphicsItem()
-        temp_item.paint(painter, option, None)
+        doc.documentLayout().draw(painter, ctx)
         painter.restore()
 
+    @staticmethod
+    def _text_doc(text: str, family: str, weight: str, color: str, base_pt: int, html: bool = False):
+        """Return (QTextDocument, PaintContext, boundingRect) for text, laid out once per export.
+
+        A bare QTextDocument lays out exactly like the canvas QGraphicsTextItem
+        (same default margin, size == boundingRect) without the graphics-item
+        paint machinery. Draw it with ``doc.documentLayout().draw(painter, ctx)``.
+        """
+        key = (text, family, weight, color, base_pt, html)
+        cached = ImageExporter._text_item_cache.get(key)
+        if cached is None:
+            doc = QTextDocument()
+            doc.setDefaultFont(ImageExporter._cached_font(family, weight, base_pt))
+            if html:
+                doc.setHtml(text)
+            else:
+                doc.setPlainText(text)
+            ctx = QAbstractTextDocumentLayout.PaintContext()
+            ctx.palette.setColor(QPalette.ColorRole.Text, _qcolor(color))
+            cached = (doc, ctx, QRectF(0, 0, doc.size().width(), doc.size().height()))
+            ImageExporter._text_item_cache[key] = cached
+        return cached
+
+    @staticmethod
+    def _is_plain_text(text: str) -> bool:
+        """True when setHtml(text) would lay out identically to setPlainText(text).
+
+        Labels such as "(a)" or "Fig. 1" carry no markup, entities or
+        whitespace that HTML would collapse, so the HTML parser can be skipped.
+        """
+        if '<' in text or '&' in text or '\n' in text or '\t' in text or '  ' in text:
+            return False
+        return text == text.strip()
+
+
+    @staticmethod
+    def _cached_font(family: str, weight: str, base_pt: int) -> QFont:
+        """Return a shared QFont for (family, weight, base_pt)."""
+        key = (family, weight, base_pt)
+        font = ImageExporter._font_cache.get(key)
+        if font is None:
+            font = QFont(family, base_pt)
+            if weight == "bold":
+                font.setBold(True)
+            ImageExporter._font_cache[key] = font
+        return font
+
     @staticmethod
     def _text_position_mm(text_item, layout_result, tw_mm: float, th_mm: float):
         """Compute (x_mm, y_mm) top-left origin for a text item given its size."""
         if text_item.scope == "cell" and text_item.parent_id and text_item.parent_id in layout_result.cell_rects:
             cx, cy, cw, ch = layout_result.cell_rects[text_item.parent_id]
-            anchor = text_item.anchor or "top_left_inside"
+            v, h = _anchor_sides(text_item.anchor or "top_left_inside")
             ox, oy = text_item.offset_x, text_item.offset_y
-            if "top" in anchor:
+            if v < 0:
                 y_mm = cy + oy
-            elif "bottom" in anchor:
+            elif v > 0:
                 y_mm = cy + ch - oy - th_mm
             else:
                 y_mm = cy + (ch - th_mm) / 2
-            if "left" in anchor:
+            if h < 0:
                 x_mm = cx + ox
-            elif "right" in anchor:
+            elif h > 0:
                 x_mm = cx + cw - ox - tw_mm
             else:
                 x_mm = cx + (cw - tw_mm) / 2
@@ -783,7 +1173,7 @@ class ImageExporter:
     def _draw_label_cells(painter: QPainter, project, layout_result, scale: float):
         """Draw label cells (label rows above picture rows) with centered text.
         
-        Uses the same QGraphicsTextItem rendering approach as _draw_text to
+        Uses the same text layout path (_text_doc) as _draw_text to
         ensure font size matches the canvas exactly.
         """
         label_rects = getattr(layout_result, 'label_rects', {})
@@ -801,25 +1191,23 @@ class ImageExporter:
         font_size_pt = project.label_font_size
         text_scale = font_size_pt / base_pt
 
-        font = QFont(project.label_font_family, base_pt)
-        if project.label_font_weight == "bold":
-            font.setBold(True)
-
         align = getattr(project, 'label_align', 'center')
         ox_mm = getattr(project, 'label_offset_x', 0.0)
         oy_mm = getattr(project, 'label_offset_y', 0.0)
+        # Every label shares one font, colour and scale: resolve them once.
+        family, weight, color = project.label_font_family, project.label_font_weight, project.label_color
+        render_scale = text_scale * scale
 
+        # One save/restore around the whole loop; each label only swaps the
+        # transform back to the base one instead of pushing full state.
+        painter.save()
+        base_transform = painter.transform()
         for cell_id, (lx, ly, lw, lh) in label_rects.items():
             text = numbering_texts.get(cell_id, "")
             if not text:
                 continue
 
-            temp_item = QGraphicsTextItem()
-            temp_item.setPlainText(text)
-            temp_item.setFont(font)
-            temp_item.setDefaultTextColor(QColor(project.label_color))
-
-            base_rect = temp_item.boundingRect()
+            doc, ctx, base_rect = ImageExporter._text_doc(text, family, weight, color, base_pt)
             tw_mm = base_rect.width() * text_scale
             th_mm = base_rect.height() * text_scale
 
@@ -833,21 +1221,61 @@ class ImageExporter:
             else:
                 x_mm = cell_x_mm + (lw - tw_mm) / 2.0
 
-            render_scale = text_scale * scale
-            painter.save()
+            painter.setTransform(base_transform)
             painter.translate(x_mm * scale, y_mm * scale)
             painter.scale(render_scale, render_scale)
-            option = QStyleOptionGraphicsItem()
-            temp_item.paint(painter, option, None)
-            painter.restore()
+            doc.documentLayout().draw(painter, ctx)
+        painter.restore()
+
+    @staticmethod
+    def _source_pixel_size(img_path: str):
+        """(width, height) of a raster source in pixels; 1000x1000 if unknown.
+
+        Always the file's native size: prefetched decodes may be downscaled.
+        """
+        if not ImageExporter._exists(img_path):
+            return 1000, 1000
+        return ImageExporter._pixel_size(img_path) or (1000, 1000)
+
+    @staticmethod
+    def _pixel_size(path: str):
+        """Native (width, height) of a raster file from its header, or None.
+
+        Cached by (path, mtime) across exports; Qt reads the header without
+        creating a decoder, PIL covers the formats Qt lacks. Vector sources
+        are left to PIL (so SVGs stay unknown and scale bars keep their
+        fallback), since Qt's SVG plugin would report an intrinsic size.
+        """
+        try:
+            key = (os.path.abspath(path), os.path.getmtime(path))
+        except OSError:
+            return None
+        if key in _PIXEL_SIZE_CACHE:
+            _PIXEL_SIZE_CACHE.move_to_end(key)
+            return _PIXEL_SIZE_CACHE[key]
+        size = None
+        native = (QImageReader(path).size() if _ext(path) not in ('.svg', '.pdf', '.eps')
+                  else QSize())
+        if native.isValid() and not native.isEmpty():
+            size = (native.width(), native.height())
+        else:
+            try:
+                with Image.open(path) as img:
+                    size = img.size
+            except Exception:
+                pass
+        _PIXEL_SIZE_CACHE[key] = size
+        if len(_PIXEL_SIZE_CACHE) > _PIXEL_SIZE_CACHE_MAX_ITEMS:
+            _PIXEL_SIZE_CACHE.popitem(last=False)
+        return size
 
     @staticmethod
     def _draw_scale_bar(painter: QPainter, obj, content_rect: QRectF, scale: float, fit_mode_override=None):
         """Draw scale bar on the exported image (works for Cell or PiPItem)."""
         # Ensure we have all necessary attributes (PiPItem/Cell compatibility)
-        um_per_px = getattr(obj, "scale_bar_um_per_px", 0.1301)
+        um_per_px = getattr(obj, "scale_bar_um_per_px", _DEFAULT_UM_PER_PX)
         if um_per_px <= 0:
-            um_per_px = 0.1301
+            um_per_px = _DEFAULT_UM_PER_PX
         
         length_um = getattr(obj, "scale_bar_length_um", 10.0)
         unit = getattr(obj, "scale_bar_unit", "µm")
@@ -861,17 +1289,8 @@ class ImageExporter:
         offset_y = getattr(obj, "scale_bar_offset_y", 2.0)
 
         # Get image dimensions for scale calculation
-        from PIL import Image
-        img_path = getattr(obj, "image_path", None)
-        try:
-            if img_path and os.path.exists(img_path):
-                with Image.open(img_path) as img:
-                    orig_w, orig_h = img.size
-            else:
-                orig_w, orig_h = 1000, 1000
-        except Exception:
-            orig_w, orig_h = 1000, 1000
-        
+        orig_w, orig_h = ImageExporter._source_pixel_size(getattr(obj, "image_path", None))
+
         # Crop
         cl = getattr(obj, "crop_left", 0.0)
         ct = getattr(obj, "crop_top", 0.0)
@@ -894,21 +1313,9 @@ class ImageExporter:
             scale_ratio = content_rect.width() / eff_pix_w
             img_rect = content_rect
         else:
-            fit_mode_str = getattr(obj, "fit_mode", "contain")
-            from src.model.enums import FitMode
-            fit_mode = FitMode(fit_mode_str)
-            if fit_mode == FitMode.CONTAIN:
-                scale_ratio = min(content_rect.width() / eff_pix_w, content_rect.height() / eff_pix_h)
-            else:  # COVER
-                scale_ratio = max(content_rect.width() / eff_pix_w, content_rect.height() / eff_pix_h)
-            
-            new_w = eff_pix_w * scale_ratio
-            new_h = eff_pix_h * scale_ratio
-            img_rect = QRectF(
-                content_rect.left() + (content_rect.width() - new_w) / 2,
-                content_rect.top() + (content_rect.height() - new_h) / 2,
-                new_w, new_h
-            )
+            # eff_pix_* are already rotated, so fit them unrotated.
+            img_rect, scale_ratio = ImageExporter._compute_target_rect(
+                content_rect, eff_pix_w, eff_pix_h, getattr(obj, "fit_mode", "contain"))
         
         # Bar length in output pixels
         bar_length_out = bar_length_px * scale_ratio
@@ -925,13 +1332,13 @@ class ImageExporter:
         else:  # bottom_right
             bar_x = img_rect.right() - ox - bar_length_out
         
-        painter.fillRect(QRectF(bar_x, bar_y, bar_length_out, bar_thickness_out), QColor(color))
+        painter.fillRect(QRectF(bar_x, bar_y, bar_length_out, bar_thickness_out), _qcolor(color))
         
         if show_text:
             if custom_text:
                 text = custom_text
             else:
-                factor = {"m": 1e6, "cm": 1e4, "dm": 1e5, "mm": 1e3, "µm": 1.0, "nm": 1e-3, "pm": 1e-6, "fm": 1e-9}.get(unit, 1.0)
+                factor = _UNIT_TO_UM.get(unit, 1.0)
                 display_val = length_um / factor
                 text = f"{display_val:.0f} {unit}" if display_val >= 1 or display_val == 0 else f"{display_val:.2f} {unit}"
 
@@ -939,12 +1346,7 @@ class ImageExporter:
             text_scale = text_size_mm / base_pt
             render_scale = text_scale * scale
 
-            temp_item = QGraphicsTextItem()
-            temp_item.setPlainText(text)
-            temp_item.setFont(QFont("Arial", base_pt))
-            temp_item.setDefaultTextColor(QColor(color))
-
-            br = temp_item.boundingRect()
+            doc, ctx, br = ImageExporter._text_doc(text, "Arial", "normal", color, base_pt)
             tw_out = br.width() * render_scale
             th_out = br.height() * render_scale
 
@@ -954,6 +1356,5 @@ class ImageExporter:
             painter.save()
             painter.translate(tx_out, ty_out)
             painter.scale(render_scale, render_scale)
-            option = QStyleOptionGraphicsItem()
-            temp_item.paint(painter, option, None)
+            doc.documentLayout().draw(painter, ctx)
             painter.restore()
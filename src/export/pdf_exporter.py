@@ -1,14 +1,47 @@
-from PyQt6.QtGui import QPdfWriter, QPainter, QPageSize, QPageLayout, QFont, QImage, QColor
+from PyQt6.QtGui import QPdfWriter, QPainter, QPageSize, QPageLayout, QImage, QTransform
 from PyQt6.QtCore import QSizeF, QRectF, QMarginsF, Qt
-from PyQt6.QtWidgets import QGraphicsTextItem, QStyleOptionGraphicsItem
 from PyQt6.QtSvg import QSvgRenderer
-from PIL import Image
+from concurrent.futures import ThreadPoolExecutor
 import os
 from src.model.data_model import Project, Cell
 from src.model.enums import FitMode
 from src.model.layout_engine import LayoutEngine
+from src.export.image_exporter import ImageExporter, _ext, _fit_mode, _qcolor
+
+# Set True to print page-geometry diagnostics on every export.
+_DEBUG = False
+
+# (abspath, mtime) -> decoded QImage, memoised for the duration of one
+# export() so an image shown in several cells/PiPs is decoded only once.
+_RASTER_CACHE = {}
+# (abspath, mtime, override_bytes) -> (QSvgRenderer, defaultSize, raster_key)
+# or None for invalid files; same lifetime as _RASTER_CACHE. The renderers
+# themselves are shared across exports via ImageExporter._load_svg().
+_SVG_CACHE = {}
+# (svg cache key, w_dots, h_dots) -> QImage for SVGs rasterised because
+# they exceed _svg_raster_threshold; same lifetime.
+_SVG_RASTER_CACHE = {}
+# (abspath, mtime, zoom) -> full first-page QImage rendered by PyMuPDF for
+# PDF/EPS files drawn as rasters (PiP insets); same lifetime.
+_PDF_RASTER_CACHE = {}
+# (abspath, mtime) -> open fitz.Document (None when it has no pages), so a
+# PDF/EPS inset placed several times is opened once; closed after export().
+_PDF_DOC_CACHE = {}
+# SVGs with more elements than this are drawn from a bitmap rendered once at
+# export resolution instead of as vectors (0 = always vector). Set from the
+# "pdf_svg_raster_threshold" preference via set_svg_raster_threshold().
+_svg_raster_threshold = 0
+# Largest bitmap (in dots) a rasterised SVG may use; bigger draws stay vector.
+_SVG_RASTER_MAX_PIXELS = 16 << 20
+
 
 class PdfExporter:
+    @staticmethod
+    def set_svg_raster_threshold(n_elements: int) -> None:
+        """Rasterise SVGs above *n_elements* elements in PDF export (0 = never)."""
+        global _svg_raster_threshold
+        _svg_raster_threshold = max(0, int(n_elements))
+
     @staticmethod
     def export(project: Project, output_path: str):
         writer = QPdfWriter(output_path)
@@ -36,8 +69,9 @@ class PdfExporter:
             region_dx_mm = 0.0
             region_dy_mm = 0.0
         
-        print(f"DEBUG: Exporting PDF: {page_w_mm}mm x {page_h_mm}mm at {project.dpi} DPI")
-        print(f"DEBUG: Scale factor (dpi/25.4): {project.dpi / 25.4:.2f}")
+        if _DEBUG:
+            print(f"DEBUG: Exporting PDF: {page_w_mm}mm x {page_h_mm}mm at {project.dpi} DPI")
+            print(f"DEBUG: Scale factor (dpi/25.4): {project.dpi / 25.4:.2f}")
 
         # Create custom page size using Millimeter units directly
         # Always specify dimensions as (width, height) and use Portrait orientation
@@ -52,15 +86,16 @@ class PdfExporter:
         )
         
         if not writer.setPageLayout(page_layout):
-            print("DEBUG: WARNING - setPageLayout returned False!")
+            print("WARNING: setPageLayout returned False")
         
-        # Debug: verify the actual page rect
-        actual_layout = writer.pageLayout()
-        actual_size_mm = actual_layout.pageSize().size(QPageSize.Unit.Millimeter)
-        actual_rect = actual_layout.paintRectPixels(project.dpi)
-        print(f"DEBUG: Actual page size: {actual_size_mm.width():.1f}mm x {actual_size_mm.height():.1f}mm")
-        print(f"DEBUG: Paint rect: {actual_rect.width()}x{actual_rect.height()} pixels")
-        print(f"DEBUG: Expected: {page_w_mm * project.dpi / 25.4:.0f}x{page_h_mm * project.dpi / 25.4:.0f} pixels")
+        if _DEBUG:
+            # Verify the actual page rect
+            actual_layout = writer.pageLayout()
+            actual_size_mm = actual_layout.pageSize().size(QPageSize.Unit.Millimeter)
+            actual_rect = actual_layout.paintRectPixels(project.dpi)
+            print(f"DEBUG: Actual page size: {actual_size_mm.width():.1f}mm x {actual_size_mm.height():.1f}mm")
+            print(f"DEBUG: Paint rect: {actual_rect.width()}x{actual_rect.height()} pixels")
+            print(f"DEBUG: Expected: {page_w_mm * project.dpi / 25.4:.0f}x{page_h_mm * project.dpi / 25.4:.0f} pixels")
         
         # Collect PDF/EPS-source cells for vector post-processing (Pass 2)
         pdf_source_cells = []  # list of (cell, content_rect_mm)
@@ -69,6 +104,12 @@ class PdfExporter:
         math_stamps = []
 
         painter = QPainter(writer)
+        # Set once for the whole document; the raster draw helpers rely on it.
+        painter.setRenderHint(QPainter.RenderHint.SmoothPixmapTransform)
+        # Memoised existence checks: each unique source path is stat'ed once
+        # for all cells and PiPs that reference it.
+        ImageExporter._existing = {}
+        ImageExporter._text_item_cache.clear()
         
         try:
             # Coordinate Conversion Factor: mm -> dots
@@ -84,40 +125,45 @@ class PdfExporter:
             label_rects = getattr(layout_result, 'label_rects', {})
 
             # 1. Draw Images and Scale Bars (sorted by z_index for freeform overlap support)
-            sorted_cells = sorted(project.get_all_leaf_cells(), key=lambda c: getattr(c, 'z_index', 0))
+            sorted_cells = sorted(project.get_all_leaf_cells(), key=lambda c: c.z_index)
+            cell_rects = layout_result.cell_rects
+
+            # Padded content rects for every drawable cell, computed in one
+            # pass before any painting: the mm rect (for Pass 2 vector stamping)
+            # and its dot-space QRectF are each derived exactly once.
+            bx0, by0, bx1, by1 = ImageExporter._page_bounds_mm(project)
+            rect_table = []
             for cell in sorted_cells:
-                if cell.id not in layout_result.cell_rects:
-                    continue
-                x_mm, y_mm, w_mm, h_mm = layout_result.cell_rects[cell.id]
-
-                # Convert rect to dots
-                target_rect = QRectF(
-                    x_mm * scale, y_mm * scale, w_mm * scale, h_mm * scale
-                )
-
-                # Apply Padding
-                p_top = cell.padding_top * scale
-                p_right = cell.padding_right * scale
-                p_bottom = cell.padding_bottom * scale
-                p_left = cell.padding_left * scale
-                content_rect = target_rect.adjusted(p_left, p_top, -p_right, -p_bottom)
-
-                if content_rect.width() <= 0 or content_rect.height() <= 0:
+                r = cell_rects.get(cell.id)
+                if r is None:
                     continue
-
-                if cell.image_path and os.path.exists(cell.image_path):
-                    ext = os.path.splitext(cell.image_path)[1].lower()
+                x_mm, y_mm, w_mm, h_mm = r
+                content_mm = (x_mm + cell.padding_left, y_mm + cell.padding_top,
+                              w_mm - cell.padding_left - cell.padding_right,
+                              h_mm - cell.padding_top - cell.padding_bottom)
+                if content_mm[2] * scale < 1 or content_mm[3] * scale < 1:
+                    continue  # rasterises to less than one device dot
+                if (content_mm[0] >= bx1 or content_mm[1] >= by1
+                        or content_mm[0] + content_mm[2] <= bx0
+                        or content_mm[1] + content_mm[3] <= by0):
+                    continue  # entirely outside the page / export region
+                rect_table.append((cell, content_mm, QRectF(
+                    content_mm[0] * scale, content_mm[1] * scale,
+                    content_mm[2] * scale, content_mm[3] * scale)))
+
+            # Decode the cells' raster sources on worker threads first; the
+            # (single-threaded) painter loop below then only blits.
+            PdfExporter._prefetch_rasters(rect_table)
+
+            for cell, content_mm, content_rect in rect_table:
+                if ImageExporter._exists(cell.image_path):
+                    ext = _ext(cell.image_path)
                     if ext in ('.pdf', '.eps'):
                         # Skip in Pass 1 — will be stamped as vector in Pass 2
-                        content_x_mm = (content_rect.x()) / scale
-                        content_y_mm = (content_rect.y()) / scale
-                        content_w_mm = content_rect.width() / scale
-                        content_h_mm = content_rect.height() / scale
-                        pdf_source_cells.append((cell, (content_x_mm, content_y_mm, content_w_mm, content_h_mm)))
+                        pdf_source_cells.append((cell, content_mm))
                     else:
-                        rotation = getattr(cell, 'rotation', 0)
-                        crop = (getattr(cell, 'crop_left', 0.0), getattr(cell, 'crop_top', 0.0),
-                                getattr(cell, 'crop_right', 1.0), getattr(cell, 'crop_bottom', 1.0))
+                        rotation = cell.rotation
+                        crop = (cell.crop_left, cell.crop_top, cell.crop_right, cell.crop_bottom)
                         svg_override = None
                         if cell.image_path.lower().endswith('.svg'):
                             from src.utils.svg_text_utils import get_svg_override_bytes_for_cell
@@ -125,7 +171,7 @@ class PdfExporter:
                         PdfExporter._draw_image(painter, cell.image_path, content_rect, cell.fit_mode, rotation, crop, svg_override)
 
                         # Draw scale bar if enabled
-                        if getattr(cell, 'scale_bar_enabled', False):
+                        if cell.scale_bar_enabled:
                             PdfExporter._draw_scale_bar(painter, cell, content_rect, scale)
 
                 PdfExporter._draw_pip_items(painter, project, cell, content_rect, scale)
@@ -135,20 +181,23 @@ class PdfExporter:
                 PdfExporter._draw_label_cells(painter, project, layout_result, scale)
                         
             # 2. Draw Text Items
-            for text_item in project.text_items:
-                # Skip numbering labels rendered by label cells
-                if (
-                    label_row_above
-                    and text_item.scope == 'cell'
-                    and getattr(text_item, 'subtype', None) != 'corner'
-                    and text_item.parent_id in label_rects
-                ):
-                    continue
+            # Numbering labels rendered by label cells are filtered out up front
+            for text_item in ImageExporter._text_items_to_draw(project, label_rects, label_row_above):
                 PdfExporter._draw_text(painter, project, text_item, layout_result, scale,
                                        math_stamps=math_stamps)
                 
         finally:
             painter.end()
+            _RASTER_CACHE.clear()
+            _SVG_CACHE.clear()
+            _SVG_RASTER_CACHE.clear()
+            _PDF_RASTER_CACHE.clear()
+            for doc in _PDF_DOC_CACHE.values():
+                if doc is not None:
+                    doc.close()
+            _PDF_DOC_CACHE.clear()
+            ImageExporter._text_item_cache.clear()
+            ImageExporter._existing = {}
 
         # Pass 2: stamp PDF/EPS source cells as true vector XObjects.
         # Shift source cell mm coords so they match the (possibly-cropped) PDF page origin.
@@ -238,6 +287,11 @@ class PdfExporter:
             print("PyMuPDF not installed — PDF source cells will be blank in output.")
             return
 
+        out_doc = None
+        # One open document per source path: cells repeating a PDF share
+        # it, and PyMuPDF then embeds that page as a single XObject.
+        src_docs = {}
+        tmp_path = None
         try:
             out_doc = fitz.open(output_path)
             out_page = out_doc[0]  # single-page export
@@ -254,14 +308,15 @@ class PdfExporter:
                 if not src_path or not os.path.exists(src_path):
                     continue
 
-                crop = (getattr(cell, 'crop_left', 0.0), getattr(cell, 'crop_top', 0.0),
-                        getattr(cell, 'crop_right', 1.0), getattr(cell, 'crop_bottom', 1.0))
-                fit_mode_str = getattr(cell, 'fit_mode', 'contain')
-                rotation = getattr(cell, 'rotation', 0)
+                crop = (cell.crop_left, cell.crop_top, cell.crop_right, cell.crop_bottom)
+                fit_mode_str = cell.fit_mode
+                rotation = cell.rotation
                 cl, ct, cr, cb = crop
 
                 try:
-                    src_doc = fitz.open(src_path)
+                    src_doc = src_docs.get(src_path)
+                    if src_doc is None:
+                        src_doc = src_docs[src_path] = fitz.open(src_path)
                     src_page = src_doc[0]
                     src_w_pt = src_page.rect.width
                     src_h_pt = src_page.rect.height
@@ -293,8 +348,6 @@ class PdfExporter:
                         keep_proportion=True,
                         overlay=False,
                     )
-
-                    src_doc.close()
                 except Exception as e:
                     print(f"Failed to stamp PDF source {src_path}: {e}")
 
@@ -303,16 +356,28 @@ class PdfExporter:
                 tmp_path = tmp.name
             out_doc.save(tmp_path, incremental=False, encryption=fitz.PDF_ENCRYPT_NONE)
             out_doc.close()
+            out_doc = None
             shutil.move(tmp_path, output_path)
+            tmp_path = None
 
         except Exception as e:
             print(f"Failed in PDF vector post-processing: {e}")
+        finally:
+            if out_doc is not None:
+                out_doc.close()
+            for src_doc in src_docs.values():
+                src_doc.close()
+            if tmp_path is not None and os.path.exists(tmp_path):
+                try:
+                    os.remove(tmp_path)
+                except OSError:
+                    pass
 
     @staticmethod
     def _draw_pip_items(painter: QPainter, project, cell, content_rect: QRectF, scale: float):
         """Draw all PiP insets for a cell onto the given content_rect."""
         from PyQt6.QtGui import QPen
-        pip_items = getattr(cell, 'pip_items', [])
+        pip_items = cell.pip_items
         if not pip_items:
             return
         cw = content_rect.width()
@@ -328,12 +393,12 @@ class PdfExporter:
             img_rect = inset_rect.adjusted(pad_dots, pad_dots, -pad_dots, -pad_dots)
             painter.save()
             painter.setClipRect(img_rect)
-            if pip.pip_type == "zoom" and cell.image_path and os.path.exists(cell.image_path):
+            if pip.pip_type == "zoom" and ImageExporter._exists(cell.image_path):
                 PdfExporter._draw_raster_cropped(
                     painter, cell.image_path, img_rect, "contain", 0,
                     (pip.crop_left, pip.crop_top, pip.crop_right, pip.crop_bottom)
                 )
-            elif pip.pip_type == "external" and pip.image_path and os.path.exists(pip.image_path):
+            elif pip.pip_type == "external" and ImageExporter._exists(pip.image_path):
                 PdfExporter._draw_image(painter, pip.image_path, img_rect, "contain", 0)
             painter.restore()
 
@@ -342,7 +407,7 @@ class PdfExporter:
                 # Determine correct mapping inheritance
                 current_um_per_px = getattr(pip, "scale_bar_um_per_px", 0.0)
                 if pip.pip_type == "zoom" and current_um_per_px <= 0:
-                    current_um_per_px = getattr(cell, "scale_bar_um_per_px", 0.1301)
+                    current_um_per_px = cell.scale_bar_um_per_px
                 if current_um_per_px <= 0:
                     current_um_per_px = 0.1301
                 
@@ -358,7 +423,7 @@ class PdfExporter:
                 pip.scale_bar_um_per_px = old_um
 
             if pip.border_enabled:
-                bpen = QPen(QColor(pip.border_color))
+                bpen = QPen(_qcolor(pip.border_color))
                 # Convert points to dots (1pt = 1/72 inch)
                 bpen.setWidthF(pip.border_width_pt * (project.dpi / 72.0))
                 bpen.setCosmetic(False)
@@ -374,7 +439,7 @@ class PdfExporter:
                     (pip.crop_right - pip.crop_left) * cw,
                     (pip.crop_bottom - pip.crop_top) * ch,
                 )
-                open_pen = QPen(QColor(pip.origin_box_color))
+                open_pen = QPen(_qcolor(pip.origin_box_color))
                 # Convert points to dots
                 open_pen.setWidthF(pip.origin_box_width_pt * (project.dpi / 72.0))
                 open_pen.setCosmetic(False)
@@ -387,7 +452,7 @@ class PdfExporter:
     @staticmethod
     def _draw_image(painter: QPainter, path: str, rect: QRectF, fit_mode_str: str, rotation: int = 0,
                     crop: tuple = (0.0, 0.0, 1.0, 1.0), svg_override_bytes: bytes = None):
-        ext = os.path.splitext(path)[1].lower()
+        ext = _ext(path)
 
         if ext == '.svg':
             PdfExporter._draw_svg(painter, path, rect, fit_mode_str, rotation, crop, svg_override_bytes)
@@ -401,42 +466,29 @@ class PdfExporter:
                   crop: tuple = (0.0, 0.0, 1.0, 1.0), svg_override_bytes: bytes = None):
         """Draw SVG vector image - renders as vector in PDF for best quality."""
         try:
-            from PyQt6.QtCore import QByteArray
-            from src.utils.svg_utils import sanitize_svg_bytes
-            if svg_override_bytes:
-                svg_bytes = sanitize_svg_bytes(svg_override_bytes)
-            else:
-                with open(path, "rb") as _f:
-                    svg_bytes = sanitize_svg_bytes(_f.read())
-            renderer = QSvgRenderer(QByteArray(svg_bytes))
-            if not renderer.isValid():
-                print(f"Invalid SVG file: {path}")
+            cached = PdfExporter._get_svg(path, svg_override_bytes)
+            if cached is None:
                 return
+            renderer, default_size, raster_key = cached
 
-            fit_mode = FitMode(fit_mode_str)
-            default_size = renderer.defaultSize()
             if default_size.isEmpty():
                 img_w, img_h = rect.width(), rect.height()
             else:
                 img_w, img_h = default_size.width(), default_size.height()
 
             cl, ct, cr, cb = crop
+            if (rotation == 0 and (cl, ct, cr, cb) == (0.0, 0.0, 1.0, 1.0)
+                    and PdfExporter._same_aspect(img_w, img_h, rect)):
+                # Uncropped SVG with the cell's shape: render straight into
+                # rect, skipping the fit maths and the clip save/restore.
+                PdfExporter._render_svg(painter, renderer, raster_key, rect)
+                return
+
             crop_w_frac = max(0.001, cr - cl)
             crop_h_frac = max(0.001, cb - ct)
-
-            is_sideways = rotation in [90, 270]
-            eff_crop_w = (img_h * crop_h_frac) if is_sideways else (img_w * crop_w_frac)
-            eff_crop_h = (img_w * crop_w_frac) if is_sideways else (img_h * crop_h_frac)
-
-            if fit_mode == FitMode.CONTAIN:
-                ratio = min(rect.width() / eff_crop_w, rect.height() / eff_crop_h)
-            else:
-                ratio = max(rect.width() / eff_crop_w, rect.height() / eff_crop_h)
-
-            crop_canvas_w = eff_crop_w * ratio
-            crop_canvas_h = eff_crop_h * ratio
-            crop_x = rect.left() + (rect.width() - crop_canvas_w) / 2
-            crop_y = rect.top() + (rect.height() - crop_canvas_h) / 2
+            crop_rect, ratio = ImageExporter._compute_target_rect(
+                rect, img_w * crop_w_frac, img_h * crop_h_frac, fit_mode_str, rotation)
+            crop_x, crop_y = crop_rect.left(), crop_rect.top()
 
             full_w = img_w * ratio
             full_h = img_h * ratio
@@ -445,110 +497,199 @@ class PdfExporter:
             target_rect = QRectF(full_x, full_y, full_w, full_h)
 
             painter.save()
-            painter.setClipRect(QRectF(crop_x, crop_y, crop_canvas_w, crop_canvas_h))
+            painter.setClipRect(crop_rect)
 
             if rotation != 0:
-                center = QRectF(crop_x, crop_y, crop_canvas_w, crop_canvas_h).center()
+                center = crop_rect.center()
                 painter.translate(center)
                 painter.rotate(rotation)
                 draw_rect = QRectF(-img_w * ratio / 2, -img_h * ratio / 2, img_w * ratio, img_h * ratio)
-                renderer.render(painter, draw_rect)
+                # The clip, expressed in the rotated frame.
+                visible = QTransform().rotate(-rotation).mapRect(
+                    crop_rect.translated(-center.x(), -center.y()))
+                PdfExporter._render_svg(painter, renderer, raster_key, draw_rect, visible)
             else:
-                renderer.render(painter, target_rect)
+                PdfExporter._render_svg(painter, renderer, raster_key, target_rect, crop_rect)
 
             painter.restore()
 
         except Exception as e:
             print(f"Failed to export SVG {path}: {e}")
     
+    @staticmethod
+    def _prefetch_rasters(rect_table: list):
+        """Decode every (path, shrink) the cell table will draw, in parallel.
+
+        Results land in _RASTER_CACHE under the same keys _get_qimage() uses.
+        Failures are left out so the draw call retries and reports them.
+        """
+        jobs = {}
+        for cell, _content_mm, content_rect in rect_table:
+            path = cell.image_path
+            if not ImageExporter._exists(path) or _ext(path) in ('.svg', '.pdf', '.eps'):
+                continue
+            crop = (cell.crop_left, cell.crop_top, cell.crop_right, cell.crop_bottom)
+            shrink = ImageExporter._decode_shrink(path, content_rect, cell.fit_mode, cell.rotation, crop)
+            key = (os.path.abspath(path), os.path.getmtime(path), shrink)
+            if key not in _RASTER_CACHE:
+                jobs[key] = (path, shrink)
+        if len(jobs) < 2:
+            return
+
+        def _decode(job):
+            try:
+                return ImageExporter._decode_image_cached(*job)
+            except Exception:
+                return None
+
+        workers = min(len(jobs), os.cpu_count() or 4)
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            for key, qimage in zip(jobs, pool.map(_decode, jobs.values())):
+                if qimage is not None:
+                    _RASTER_CACHE[key] = qimage
+
+    @staticmethod
+    def _get_qimage(path: str, shrink: int = 1) -> QImage:
+        """Return the decoded QImage for ``path``, decoding on first use.
+
+        Keyed by (abspath, mtime, shrink) so an edited file is never served
+        stale and each decode resolution is produced once.
+        """
+        key = (os.path.abspath(path), os.path.getmtime(path), shrink)
+        qimage = _RASTER_CACHE.get(key)
+        if qimage is None:
+            qimage = ImageExporter._decode_image_cached(path, shrink)
+            _RASTER_CACHE[key] = qimage
+        return qimage
+
+    @staticmethod
+    def _same_aspect(img_w: float, img_h: float, rect: QRectF) -> bool:
+        """True when an img_w x img_h image has (nearly) the aspect ratio of rect."""
+        if img_h <= 0 or rect.height() <= 0:
+            return False
+        return abs(img_w / img_h - rect.width() / rect.height()) < 1e-4
+
+    @staticmethod
+    def _get_svg(path: str, svg_override_bytes: bytes = None):
+        """Return (QSvgRenderer, defaultSize, raster_key) for an SVG (parsed via ImageExporter._load_svg).
+
+        raster_key is None for SVGs drawn as vectors; otherwise the SVG has
+        more elements than the project's rasterize threshold and is blitted
+        from a bitmap cached under that key (see _render_svg).
+        """
+        key = (os.path.abspath(path), os.path.getmtime(path), svg_override_bytes)
+        if key in _SVG_CACHE:
+            return _SVG_CACHE[key]
+        loaded = ImageExporter._load_svg(path, svg_override_bytes)
+        if loaded is not None:
+            renderer, n_elements = loaded
+            raster_key = None
+            if 0 < _svg_raster_threshold < n_elements:
+                raster_key = key
+            cached = (renderer, renderer.defaultSize(), raster_key)
+        else:
+            cached = None
+        _SVG_CACHE[key] = cached
+        return cached
+
+    @staticmethod
+    def _render_svg(painter: QPainter, renderer: QSvgRenderer, raster_key, rect: QRectF,
+                    visible: QRectF = None):
+        """Render an SVG into rect, as vectors or from a cached device-resolution bitmap.
+
+        ``visible`` is the part of ``rect`` that survives the caller's clip
+        (crop); only that part is rasterised. Bitmaps larger than
+        _SVG_RASTER_MAX_PIXELS fall back to vector rendering.
+        """
+        if raster_key is None:
+            renderer.render(painter, rect)
+            return
+        part = rect.intersected(visible) if visible is not None else rect
+        if part.isEmpty():
+            return
+        w, h = max(1, round(part.width())), max(1, round(part.height()))
+        if w * h > _SVG_RASTER_MAX_PIXELS:
+            renderer.render(painter, rect)
+            return
+        dx, dy = rect.left() - part.left(), rect.top() - part.top()
+        key = (raster_key, round(rect.width()), round(rect.height()), round(dx), round(dy), w, h)
+        image = _SVG_RASTER_CACHE.get(key)
+        if image is None:
+            image = QImage(w, h, QImage.Format.Format_ARGB32_Premultiplied)
+            image.fill(Qt.GlobalColor.transparent)
+            img_painter = QPainter(image)
+            img_painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+            # Lay the full SVG out at rect's size, shifted so only the visible
+            # part lands on the bitmap.
+            img_painter.translate(dx, dy)
+            renderer.render(img_painter, QRectF(0, 0, rect.width(), rect.height()))
+            img_painter.end()
+            _SVG_RASTER_CACHE[key] = image
+        painter.drawImage(part, image)
+
     @staticmethod
     def _draw_raster_cropped(painter: QPainter, path: str, rect: QRectF, fit_mode_str: str,
                              rotation: int = 0, crop: tuple = (0.0, 0.0, 1.0, 1.0)):
         """Draw raster image with a fractional crop region (cl, ct, cr, cb)."""
         try:
-            with Image.open(path) as img:
-                if img.mode != 'RGBA':
-                    img = img.convert('RGBA')
-                cl, ct, cr, cb = crop
-                fw, fh = img.width, img.height
-                cx0, cy0 = int(cl * fw), int(ct * fh)
-                cx1, cy1 = max(cx0 + 1, int(cr * fw)), max(cy0 + 1, int(cb * fh))
-                if cx0 != 0 or cy0 != 0 or cx1 != fw or cy1 != fh:
-                    img = img.crop((cx0, cy0, cx1, cy1))
-                data = img.tobytes("raw", "RGBA")
-                qimage = QImage(data, img.width, img.height, QImage.Format.Format_RGBA8888)
-                fit_mode = FitMode(fit_mode_str)
-                iw, ih = qimage.width(), qimage.height()
-                is_sideways = rotation in [90, 270]
-                ew = ih if is_sideways else iw
-                eh = iw if is_sideways else ih
-                if fit_mode == FitMode.CONTAIN:
-                    ratio = min(rect.width() / ew, rect.height() / eh)
-                else:
-                    ratio = max(rect.width() / ew, rect.height() / eh)
-                nw, nh = ew * ratio, eh * ratio
-                x = rect.left() + (rect.width() - nw) / 2
-                y = rect.top() + (rect.height() - nh) / 2
-                target = QRectF(x, y, nw, nh)
-                painter.save()
-                painter.setRenderHint(QPainter.RenderHint.SmoothPixmapTransform)
-                painter.drawImage(target, qimage)
-                painter.restore()
+            qimage = PdfExporter._get_qimage(
+                path, ImageExporter._decode_shrink(path, rect, fit_mode_str, rotation, crop))
+            if qimage is None:
+                return
+            cl, ct, cr, cb = crop
+            fw, fh = qimage.width(), qimage.height()
+            cx0, cy0 = int(cl * fw), int(ct * fh)
+            cx1, cy1 = max(cx0 + 1, int(cr * fw)), max(cy0 + 1, int(cb * fh))
+            if cx0 != 0 or cy0 != 0 or cx1 != fw or cy1 != fh:
+                qimage = qimage.copy(cx0, cy0, cx1 - cx0, cy1 - cy0)
+            target, _ratio = ImageExporter._compute_target_rect(
+                rect, qimage.width(), qimage.height(), fit_mode_str, rotation)
+            painter.drawImage(target, qimage)
         except Exception as e:
             print(f"Failed to export cropped image {path}: {e}")
 
     @staticmethod
     def _draw_raster(painter: QPainter, path: str, rect: QRectF, fit_mode_str: str, rotation: int = 0,
                      crop: tuple = (0.0, 0.0, 1.0, 1.0)):
-        """Draw raster image using PIL, honouring crop."""
+        """Draw raster image (decoded once per export), honouring crop."""
         try:
-            with Image.open(path) as img:
-                if img.mode != 'RGBA':
-                    img = img.convert('RGBA')
+            qimage = PdfExporter._get_qimage(
+                path, ImageExporter._decode_shrink(path, rect, fit_mode_str, rotation, crop))
+            if qimage is None:
+                return
 
-                cl, ct, cr, cb = crop
-                full_w, full_h = img.width, img.height
-                cx0 = int(cl * full_w)
-                cy0 = int(ct * full_h)
-                cx1 = max(cx0 + 1, int(cr * full_w))
-                cy1 = max(cy0 + 1, int(cb * full_h))
-                if cx0 != 0 or cy0 != 0 or cx1 != full_w or cy1 != full_h:
-                    img = img.crop((cx0, cy0, cx1, cy1))
-
-                data = img.tobytes("raw", "RGBA")
-                qimage = QImage(data, img.width, img.height, QImage.Format.Format_RGBA8888)
-
-                fit_mode = FitMode(fit_mode_str)
-                img_w = qimage.width()
-                img_h = qimage.height()
-
-                is_sideways = rotation in [90, 270]
-                eff_img_w = img_h if is_sideways else img_w
-                eff_img_h = img_w if is_sideways else img_h
-
-                if fit_mode == FitMode.CONTAIN:
-                    ratio = min(rect.width() / eff_img_w, rect.height() / eff_img_h)
-                else:
-                    ratio = max(rect.width() / eff_img_w, rect.height() / eff_img_h)
-
-                new_w = eff_img_w * ratio
-                new_h = eff_img_h * ratio
-                x = rect.left() + (rect.width() - new_w) / 2
-                y = rect.top() + (rect.height() - new_h) / 2
-                target_rect = QRectF(x, y, new_w, new_h)
+            cl, ct, cr, cb = crop
+            full_w, full_h = qimage.width(), qimage.height()
+            cx0 = int(cl * full_w)
+            cy0 = int(ct * full_h)
+            cx1 = max(cx0 + 1, int(cr * full_w))
+            cy1 = max(cy0 + 1, int(cb * full_h))
+            if cx0 != 0 or cy0 != 0 or cx1 != full_w or cy1 != full_h:
+                qimage = qimage.copy(cx0, cy0, cx1 - cx0, cy1 - cy0)
 
-                painter.save()
-                if fit_mode == FitMode.COVER:
-                    painter.setClipRect(rect)
-                painter.setRenderHint(QPainter.RenderHint.SmoothPixmapTransform)
-                if rotation != 0:
-                    painter.translate(target_rect.center())
-                    painter.rotate(rotation)
-                    draw_rect = QRectF(-img_w * ratio / 2, -img_h * ratio / 2, img_w * ratio, img_h * ratio)
-                    painter.drawImage(draw_rect, qimage)
-                else:
-                    painter.drawImage(target_rect, qimage)
-                painter.restore()
+            img_w = qimage.width()
+            img_h = qimage.height()
+
+            if rotation == 0 and PdfExporter._same_aspect(img_w, img_h, rect):
+                # Image already has the cell's shape: contain and cover both
+                # reduce to filling rect exactly, with nothing to clip.
+                painter.drawImage(rect, qimage)
+                return
+
+            target_rect, ratio = ImageExporter._compute_target_rect(
+                rect, img_w, img_h, fit_mode_str, rotation)
+
+            painter.save()
+            if _fit_mode(fit_mode_str) == FitMode.COVER:
+                painter.setClipRect(rect)
+            if rotation != 0:
+                painter.translate(target_rect.center())
+                painter.rotate(rotation)
+                draw_rect = QRectF(-img_w * ratio / 2, -img_h * ratio / 2, img_w * ratio, img_h * ratio)
+                painter.drawImage(draw_rect, qimage)
+            else:
+                painter.drawImage(target_rect, qimage)
+            painter.restore()
 
         except Exception as e:
             print(f"Failed to export image {path}: {e}")
@@ -564,60 +705,24 @@ class PdfExporter:
         export DPI (e.g. 600 DPI) — indistinguishable from vector in print.
         """
         try:
-            import fitz  # PyMuPDF
-
-            doc = fitz.open(path)
-            if doc.page_count == 0:
-                doc.close()
+            qimage = PdfExporter._get_pdf_page_image(path, rect, fit_mode_str, crop)
+            if qimage is None:
                 return
-
-            page = doc[0]
-            # PDF natural size is in points (72 dpi). Zoom to match rect in dots.
-            page_rect = page.rect  # in points
             cl, ct, cr, cb = crop
-            cropped_w_pts = max(1.0, (cr - cl) * page_rect.width)
-            cropped_h_pts = max(1.0, (cb - ct) * page_rect.height)
-            zoom_x = rect.width() / cropped_w_pts
-            zoom_y = rect.height() / cropped_h_pts
-            zoom = max(zoom_x, zoom_y) if FitMode(fit_mode_str) == FitMode.COVER \
-                else min(zoom_x, zoom_y)
-            zoom = max(zoom, 1.0)  # never render below 1× (72 dpi)
-            matrix = fitz.Matrix(zoom, zoom)
-            pix = page.get_pixmap(matrix=matrix, alpha=True)
-            doc.close()
-
-            qimage = QImage(pix.samples, pix.width, pix.height, pix.stride,
-                            QImage.Format.Format_RGBA8888).copy()
-
             # Apply crop
-            cl, ct, cr, cb = crop
             iw, ih = qimage.width(), qimage.height()
             cx0, cy0 = int(cl * iw), int(ct * ih)
             cx1, cy1 = max(cx0 + 1, int(cr * iw)), max(cy0 + 1, int(cb * ih))
             if cx0 != 0 or cy0 != 0 or cx1 != iw or cy1 != ih:
                 qimage = qimage.copy(cx0, cy0, cx1 - cx0, cy1 - cy0)
 
-            fit_mode = FitMode(fit_mode_str)
             img_w, img_h = qimage.width(), qimage.height()
-
-            is_sideways = rotation in [90, 270]
-            eff_w = img_h if is_sideways else img_w
-            eff_h = img_w if is_sideways else img_h
-
-            if fit_mode == FitMode.CONTAIN:
-                ratio = min(rect.width() / eff_w, rect.height() / eff_h)
-            else:
-                ratio = max(rect.width() / eff_w, rect.height() / eff_h)
-
-            nw, nh = eff_w * ratio, eff_h * ratio
-            x = rect.left() + (rect.width() - nw) / 2
-            y = rect.top() + (rect.height() - nh) / 2
-            target_rect = QRectF(x, y, nw, nh)
+            target_rect, ratio = ImageExporter._compute_target_rect(
+                rect, img_w, img_h, fit_mode_str, rotation)
 
             painter.save()
-            if fit_mode == FitMode.COVER:
+            if _fit_mode(fit_mode_str) == FitMode.COVER:
                 painter.setClipRect(rect)
-            painter.setRenderHint(QPainter.RenderHint.SmoothPixmapTransform)
             if rotation != 0:
                 painter.translate(target_rect.center())
                 painter.rotate(rotation)
@@ -631,6 +736,48 @@ class PdfExporter:
         except Exception as e:
             print(f"Failed to export PDF {path}: {e}")
 
+    @staticmethod
+    def _get_pdf_page_image(path: str, rect: QRectF, fit_mode_str: str, crop: tuple):
+        """Render the first page of a PDF/EPS at the zoom ``rect`` needs (memoised).
+
+        Repeated insets of the same file reuse one open document, and those
+        at the same size reuse one render. Returns None for an empty document.
+        """
+        import fitz  # PyMuPDF
+
+        doc_key = (os.path.abspath(path), os.path.getmtime(path))
+        if doc_key in _PDF_DOC_CACHE:
+            doc = _PDF_DOC_CACHE[doc_key]
+        else:
+            doc = fitz.open(path)
+            if doc.page_count == 0:
+                doc.close()
+                doc = None
+            _PDF_DOC_CACHE[doc_key] = doc
+        if doc is None:
+            return None
+        page = doc[0]
+        # PDF natural size is in points (72 dpi). Zoom to match rect in dots.
+        page_rect = page.rect  # in points
+        cl, ct, cr, cb = crop
+        cropped_w_pts = max(1.0, (cr - cl) * page_rect.width)
+        cropped_h_pts = max(1.0, (cb - ct) * page_rect.height)
+        zoom_x = rect.width() / cropped_w_pts
+        zoom_y = rect.height() / cropped_h_pts
+        zoom = max(zoom_x, zoom_y) if _fit_mode(fit_mode_str) == FitMode.COVER \
+            else min(zoom_x, zoom_y)
+        zoom = round(max(zoom, 1.0), 4)  # never render below 1× (72 dpi)
+        key = doc_key + (zoom,)
+        qimage = _PDF_RASTER_CACHE.get(key)
+        if qimage is None:
+            pix = page.get_pixmap(matrix=fitz.Matrix(zoom, zoom), alpha=True)
+            # pix.samples is already a private bytes copy that PyQt keeps
+            # alive with the QImage, so wrap it directly.
+            qimage = QImage(pix.samples, pix.width, pix.height, pix.stride,
+                            QImage.Format.Format_RGBA8888)
+            _PDF_RASTER_CACHE[key] = qimage
+        return qimage
+
     @staticmethod
     def _draw_text(painter: QPainter, project: Project, text_item, layout_result,
                    scale: float, math_stamps: list = None):
@@ -725,16 +872,9 @@ class PdfExporter:
         base_pt = 24
         text_scale = text_item.font_size_pt / base_pt
 
-        temp_item = QGraphicsTextItem()
-        temp_item.setHtml(text_item.text)
-
-        font = QFont(text_item.font_family, base_pt)
-        if text_item.font_weight == "bold":
-            font.setBold(True)
-        temp_item.setFont(font)
-        temp_item.setDefaultTextColor(QColor(text_item.color))
-
-        base_rect = temp_item.boundingRect()
+        doc, ctx, base_rect = ImageExporter._text_doc(
+            text_item.text, text_item.font_family, text_item.font_weight, text_item.color,
+            base_pt, html=not ImageExporter._is_plain_text(text_item.text))
         tw_mm = base_rect.width() * text_scale
         th_mm = base_rect.height() * text_scale
 
@@ -771,87 +911,23 @@ class PdfExporter:
             pad = float(getattr(text_item, 'bg_padding_mm', 0.6)) * scale
             painter.save()
             painter.setPen(Qt.PenStyle.NoPen)
-            painter.setBrush(_QB(QColor(getattr(text_item, 'bg_color', '#FFFFFF'))))
+            painter.setBrush(_QB(_qcolor(getattr(text_item, 'bg_color', '#FFFFFF'))))
             painter.drawRect(QRectF(-pad, -pad, tw_mm * scale + 2 * pad, th_mm * scale + 2 * pad))
             painter.restore()
         painter.scale(render_scale, render_scale)
         
-        # Paint the QGraphicsTextItem directly to the PDF painter
-        option = QStyleOptionGraphicsItem()
-        temp_item.paint(painter, option, None)
+        doc.documentLayout().draw(painter, ctx)
         
         painter.restore()
 
     @staticmethod
     def _draw_label_cells(painter: QPainter, project, layout_result, scale: float):
         """Draw label cells (label rows above picture rows) with centered text.
-        
-        Uses the same QGraphicsTextItem rendering approach as _draw_text to
-        ensure font size matches the canvas exactly.
-        """
-        label_rects = getattr(layout_result, 'label_rects', {})
-        if not label_rects:
-            return
-
-        # Build numbering text map from TextItems
-        numbering_texts = {}
-        for t in project.text_items:
-            if t.scope == 'cell' and getattr(t, 'subtype', None) != 'corner' and t.parent_id:
-                numbering_texts[t.parent_id] = t.text
-
-        # Use same base_pt / text_scale approach as _draw_text and TextGraphicsItem
-        base_pt = 24
-        font_size_pt = project.label_font_size
-        text_scale = font_size_pt / base_pt
-
-        font = QFont(project.label_font_family, base_pt)
-        if project.label_font_weight == "bold":
-            font.setBold(True)
 
-        align = getattr(project, 'label_align', 'center')
-        ox_mm = getattr(project, 'label_offset_x', 0.0)
-        oy_mm = getattr(project, 'label_offset_y', 0.0)
-
-        for cell_id, (lx, ly, lw, lh) in label_rects.items():
-            text = numbering_texts.get(cell_id, "")
-            if not text:
-                continue
-
-            # Create a temporary QGraphicsTextItem to measure and render
-            temp_item = QGraphicsTextItem()
-            temp_item.setPlainText(text)
-            temp_item.setFont(font)
-            temp_item.setDefaultTextColor(QColor(project.label_color))
-
-            base_rect = temp_item.boundingRect()
-            tw_mm = base_rect.width() * text_scale
-            th_mm = base_rect.height() * text_scale
-
-            # Position within label cell (mm), applying alignment and offsets
-            cell_x_mm = lx + ox_mm
-            cell_y_mm = ly + oy_mm
-            cell_w_mm = lw
-            cell_h_mm = lh
-
-            # Vertical: center in label cell
-            y_mm = cell_y_mm + (cell_h_mm - th_mm) / 2.0
-
-            # Horizontal: align within label cell
-            if align == 'left':
-                x_mm = cell_x_mm
-            elif align == 'right':
-                x_mm = cell_x_mm + cell_w_mm - tw_mm
-            else:
-                x_mm = cell_x_mm + (cell_w_mm - tw_mm) / 2.0
-
-            # Render using painter.scale — same approach as _draw_text
-            render_scale = text_scale * scale
-            painter.save()
-            painter.translate(x_mm * scale, y_mm * scale)
-            painter.scale(render_scale, render_scale)
-            option = QStyleOptionGraphicsItem()
-            temp_item.paint(painter, option, None)
-            painter.restore()
+        The geometry is identical for every output, so this shares
+        ImageExporter's implementation (and its per-export text layout cache).
+        """
+        ImageExporter._draw_label_cells(painter, project, layout_result, scale)
 
     @staticmethod
     def _draw_scale_bar(painter: QPainter, obj, content_rect: QRectF, scale: float, fit_mode_override=None):
@@ -873,18 +949,8 @@ class PdfExporter:
         offset_x = getattr(obj, "scale_bar_offset_x", 2.0)
         offset_y = getattr(obj, "scale_bar_offset_y", 2.0)
 
-        # Get image dimensions for scale calculation
-        from PIL import Image
-        import os
-        img_path = getattr(obj, "image_path", None)
-        try:
-            if img_path and os.path.exists(img_path):
-                with Image.open(img_path) as img:
-                    orig_w, orig_h = img.size
-            else:
-                orig_w, orig_h = 1000, 1000
-        except Exception:
-            orig_w, orig_h = 1000, 1000
+        # Get image dimensions for scale calculation (cached header read)
+        orig_w, orig_h = ImageExporter._source_pixel_size(getattr(obj, "image_path", None))
         
         # Crop
         cl = getattr(obj, "crop_left", 0.0)
@@ -908,21 +974,9 @@ class PdfExporter:
             scale_ratio = content_rect.width() / eff_pix_w
             img_rect = content_rect
         else:
-            fit_mode_str = getattr(obj, "fit_mode", "contain")
-            from src.model.enums import FitMode
-            fit_mode = FitMode(fit_mode_str)
-            if fit_mode == FitMode.CONTAIN:
-                scale_ratio = min(content_rect.width() / eff_pix_w, content_rect.height() / eff_pix_h)
-            else:  # COVER
-                scale_ratio = max(content_rect.width() / eff_pix_w, content_rect.height() / eff_pix_h)
-            
-            new_w = eff_pix_w * scale_ratio
-            new_h = eff_pix_h * scale_ratio
-            img_rect = QRectF(
-                content_rect.left() + (content_rect.width() - new_w) / 2,
-                content_rect.top() + (content_rect.height() - new_h) / 2,
-                new_w, new_h
-            )
+            # eff_pix_* are already rotated, so fit them unrotated.
+            img_rect, scale_ratio = ImageExporter._compute_target_rect(
+                content_rect, eff_pix_w, eff_pix_h, getattr(obj, "fit_mode", "contain"))
         
         bar_length_dots = bar_length_px * scale_ratio
         bar_thickness_dots = thickness_mm * scale
@@ -938,7 +992,7 @@ class PdfExporter:
         else:  # bottom_right
             bar_x = img_rect.right() - ox - bar_length_dots
         
-        painter.fillRect(QRectF(bar_x, bar_y, bar_length_dots, bar_thickness_dots), QColor(color))
+        painter.fillRect(QRectF(bar_x, bar_y, bar_length_dots, bar_thickness_dots), _qcolor(color))
         
         if show_text:
             if custom_text:
@@ -952,12 +1006,7 @@ class PdfExporter:
             text_scale = text_size_mm / base_pt
             render_scale = text_scale * scale
 
-            temp_item = QGraphicsTextItem()
-            temp_item.setPlainText(text)
-            temp_item.setFont(QFont("Arial", base_pt))
-            temp_item.setDefaultTextColor(QColor(color))
-
-            br = temp_item.boundingRect()
+            doc, ctx, br = ImageExporter._text_doc(text, "Arial", "normal", color, base_pt)
             tw_dots = br.width() * render_scale
             th_dots = br.height() * render_scale
 
@@ -967,6 +1016,5 @@ class PdfExporter:
             painter.save()
             painter.translate(tx_dots, ty_dots)
             painter.scale(render_scale, render_scale)
-            option = QStyleOptionGraphicsItem()
-            temp_item.paint(painter, option, None)
+            doc.documentLayout().draw(painter, ctx)
             painter.restore()
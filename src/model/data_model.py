@@ -1,11 +1,41 @@
 import json
+import operator
 import os
+import sys
 import uuid
 from dataclasses import dataclass, field, fields
 from typing import List, Optional, Dict, Any
 from .enums import FitMode, LabelPosition, PageSizePreset
 from src.version import APP_VERSION
 
+def _intern_fields(payload: Dict[str, Any], keys: tuple) -> None:
+    """sys.intern the enum-like string values of ``payload`` in place.
+
+    json.load gives every occurrence of e.g. "center" its own str; interning
+    makes all loaded items share one object per distinct value.
+    """
+    for k in keys:
+        v = payload.get(k)
+        if type(v) is str:
+            payload[k] = sys.intern(v)
+
+
+# Enum-like TextItem / Cell string fields shared across many loaded items.
+_TEXT_ITEM_INTERNED = ("font_family", "font_weight", "color", "scope", "subtype", "anchor")
+_CELL_INTERNED = ("fit_mode", "align_h", "align_v", "scale_bar_mode", "scale_bar_color",
+                  "scale_bar_position", "scale_bar_unit", "split_direction")
+
+
+# Serialised field order for TextItem.to_dict(); values are read in one
+# C-level attrgetter call instead of one attribute lookup per key.
+_TEXT_ITEM_KEYS = (
+    "id", "text", "font_family", "font_size_pt", "font_weight", "color",
+    "scope", "subtype", "parent_id", "x", "y", "rotation", "anchor",
+    "offset_x", "offset_y", "bg_enabled", "bg_color", "bg_padding_mm",
+)
+_text_item_values = operator.attrgetter(*_TEXT_ITEM_KEYS)
+
+
 @dataclass
 class TextItem:
     id: str = field(default_factory=lambda: str(uuid.uuid4()))
@@ -41,34 +71,20 @@ class TextItem:
     bg_padding_mm: float = 0.6
 
     def to_dict(self) -> Dict[str, Any]:
-        return {
-            "id": self.id,
-            "text": self.text,
-            "font_family": self.font_family,
-            "font_size_pt": self.font_size_pt,
-            "font_weight": self.font_weight,
-            "color": self.color,
-            "scope": self.scope,
-            "subtype": self.subtype,
-            "parent_id": self.parent_id,
-            "x": self.x,
-            "y": self.y,
-            "rotation": self.rotation,
-            "anchor": self.anchor,
-            "offset_x": self.offset_x,
-            "offset_y": self.offset_y,
-            "bg_enabled": self.bg_enabled,
-            "bg_color": self.bg_color,
-            "bg_padding_mm": self.bg_padding_mm,
-        }
+        return dict(zip(_TEXT_ITEM_KEYS, _text_item_values(self)))
 
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> 'TextItem':
         # Filter to known fields so older/newer saves don't crash the loader.
-        allowed = {f.name for f in fields(cls)}
+        allowed = _TEXT_ITEM_FIELDS if cls is TextItem else {f.name for f in fields(cls)}
         clean = {k: v for k, v in data.items() if k in allowed}
+        _intern_fields(clean, _TEXT_ITEM_INTERNED)
         return cls(**clean)
 
+
+# Field names accepted by TextItem.from_dict, resolved once.
+_TEXT_ITEM_FIELDS = frozenset(f.name for f in fields(TextItem))
+
 @dataclass
 class PiPItem:
     id: str = field(default_factory=lambda: str(uuid.uuid4()))
@@ -216,6 +232,60 @@ class SizeGroup:
         return cls(**clean)
 
 
+# Serialised field order for Cell.to_dict() ("children"/"pip_items" are
+# replaced by their serialised lists after the bulk read).
+_CELL_KEYS = (
+    "id", "row_index", "col_index", "image_path", "original_source_path",
+    "fit_mode", "rotation", "align_h", "align_v", "padding_top",
+    "padding_bottom", "padding_left", "padding_right", "is_placeholder",
+    "scale_bar_enabled", "scale_bar_mode", "scale_bar_um_per_px",
+    "scale_bar_length_um", "scale_bar_color", "scale_bar_show_text",
+    "scale_bar_thickness_mm", "scale_bar_position", "scale_bar_offset_x",
+    "scale_bar_offset_y", "scale_bar_custom_text", "scale_bar_text_size_mm",
+    "scale_bar_unit", "freeform_x_mm", "freeform_y_mm", "freeform_w_mm",
+    "freeform_h_mm", "override_width_mm", "override_height_mm",
+    "aspect_ratio_locked", "size_group_id", "z_index", "crop_left", "crop_top",
+    "crop_right", "crop_bottom", "children", "split_direction", "split_ratios",
+    "pip_items", "svg_normalize_text", "svg_normalize_text_pt",
+)
+_cell_values = operator.attrgetter(*_CELL_KEYS)
+
+
+# Load-time defaults for fields older project files may not have
+# (Cell.from_dict). split_ratios is filled per cell with a fresh list.
+_CELL_LOAD_DEFAULTS = {
+    "rotation": 0,
+    "scale_bar_enabled": False,
+    "scale_bar_mode": "rgb",
+    "scale_bar_length_um": 10.0,
+    "scale_bar_color": "#FFFFFF",
+    "scale_bar_show_text": True,
+    "scale_bar_thickness_mm": 0.5,
+    "scale_bar_position": "bottom_right",
+    "scale_bar_offset_x": 2.0,
+    "scale_bar_offset_y": 2.0,
+    "scale_bar_custom_text": None,
+    "scale_bar_text_size_mm": 2.0,
+    "scale_bar_unit": "µm",
+    "freeform_x_mm": 0.0,
+    "freeform_y_mm": 0.0,
+    "freeform_w_mm": 50.0,
+    "freeform_h_mm": 50.0,
+    "override_width_mm": 0.0,
+    "override_height_mm": 0.0,
+    "aspect_ratio_locked": False,
+    "size_group_id": None,
+    "z_index": 0,
+    "split_direction": "none",
+    "svg_normalize_text": False,
+    "svg_normalize_text_pt": 8.0,
+    "crop_left": 0.0,
+    "crop_top": 0.0,
+    "crop_right": 1.0,
+    "crop_bottom": 1.0,
+}
+
+
 @dataclass
 class Cell:
     id: str = field(default_factory=lambda: str(uuid.uuid4()))
@@ -304,93 +374,25 @@ class Cell:
         return result
 
     def to_dict(self) -> Dict[str, Any]:
-        return {
-            "id": self.id,
-            "row_index": self.row_index,
-            "col_index": self.col_index,
-            "image_path": self.image_path,
-            "original_source_path": self.original_source_path,
-            "fit_mode": self.fit_mode,
-            "rotation": self.rotation,
-            "align_h": self.align_h,
-            "align_v": self.align_v,
-            "padding_top": self.padding_top,
-            "padding_bottom": self.padding_bottom,
-            "padding_left": self.padding_left,
-            "padding_right": self.padding_right,
-            "is_placeholder": self.is_placeholder,
-            "scale_bar_enabled": self.scale_bar_enabled,
-            "scale_bar_mode": self.scale_bar_mode,
-            "scale_bar_um_per_px": self.scale_bar_um_per_px,
-            "scale_bar_length_um": self.scale_bar_length_um,
-            "scale_bar_color": self.scale_bar_color,
-            "scale_bar_show_text": self.scale_bar_show_text,
-            "scale_bar_thickness_mm": self.scale_bar_thickness_mm,
-            "scale_bar_position": self.scale_bar_position,
-            "scale_bar_offset_x": self.scale_bar_offset_x,
-            "scale_bar_offset_y": self.scale_bar_offset_y,
-            "scale_bar_custom_text": self.scale_bar_custom_text,
-            "scale_bar_text_size_mm": self.scale_bar_text_size_mm,
-            "scale_bar_unit": self.scale_bar_unit,
-            "freeform_x_mm": self.freeform_x_mm,
-            "freeform_y_mm": self.freeform_y_mm,
-            "freeform_w_mm": self.freeform_w_mm,
-            "freeform_h_mm": self.freeform_h_mm,
-            "override_width_mm": self.override_width_mm,
-            "override_height_mm": self.override_height_mm,
-            "aspect_ratio_locked": self.aspect_ratio_locked,
-            "size_group_id": self.size_group_id,
-            "z_index": self.z_index,
-            "crop_left": self.crop_left,
-            "crop_top": self.crop_top,
-            "crop_right": self.crop_right,
-            "crop_bottom": self.crop_bottom,
-            "children": [c.to_dict() for c in self.children],
-            "split_direction": self.split_direction,
-            "split_ratios": self.split_ratios,
-            "pip_items": [p.to_dict() for p in self.pip_items],
-            "svg_normalize_text": self.svg_normalize_text,
-            "svg_normalize_text_pt": self.svg_normalize_text_pt,
-        }
+        d = dict(zip(_CELL_KEYS, _cell_values(self)))
+        # Nested lists are serialised in place, keeping the key order.
+        d["children"] = [c.to_dict() for c in self.children]
+        d["pip_items"] = [p.to_dict() for p in self.pip_items]
+        return d
 
     @classmethod
-    def from_dict(cls, data: Dict[str, Any], project_dir: Optional[str] = None) -> 'Cell':
-        # Backward compatibility: older projects may not have scale bar fields
-        payload = dict(data)
-        payload.setdefault("rotation", 0)
-        payload.setdefault("scale_bar_enabled", False)
-        payload.setdefault("scale_bar_mode", "rgb")
+    def from_dict(cls, data: Dict[str, Any], project_dir: Optional[str] = None,
+                  isfile_cache: Optional[Dict[str, bool]] = None) -> 'Cell':
+        # Backward compatibility: older projects may lack any of these fields.
+        # One C-level merge over the defaults replaces ~30 setdefault calls.
+        payload = {**_CELL_LOAD_DEFAULTS, **data}
         # Backward compat: derive µm/px from the old mode string when not present
-        if "scale_bar_um_per_px" not in payload:
+        if "scale_bar_um_per_px" not in data:
             _legacy = {"rgb": 0.1301, "bayer": 0.2569}
             payload["scale_bar_um_per_px"] = _legacy.get(payload.get("scale_bar_mode", "rgb"), 0.1301)
-        payload.setdefault("scale_bar_length_um", 10.0)
-        payload.setdefault("scale_bar_color", "#FFFFFF")
-        payload.setdefault("scale_bar_show_text", True)
-        payload.setdefault("scale_bar_thickness_mm", 0.5)
-        payload.setdefault("scale_bar_position", "bottom_right")
-        payload.setdefault("scale_bar_offset_x", 2.0)
-        payload.setdefault("scale_bar_offset_y", 2.0)
-        payload.setdefault("scale_bar_custom_text", None)
-        payload.setdefault("scale_bar_text_size_mm", 2.0)
-        payload.setdefault("scale_bar_unit", "µm")
-        payload.setdefault("freeform_x_mm", 0.0)
-        payload.setdefault("freeform_y_mm", 0.0)
-        payload.setdefault("freeform_w_mm", 50.0)
-        payload.setdefault("freeform_h_mm", 50.0)
-        payload.setdefault("override_width_mm", 0.0)
-        payload.setdefault("override_height_mm", 0.0)
-        payload.setdefault("aspect_ratio_locked", False)
-        payload.setdefault("size_group_id", None)
-        payload.setdefault("z_index", 0)
-        payload.setdefault("split_direction", "none")
-        payload.setdefault("split_ratios", [])
-        payload.setdefault("svg_normalize_text", False)
-        payload.setdefault("svg_normalize_text_pt", 8.0)
-        payload.setdefault("crop_left", 0.0)
-        payload.setdefault("crop_top", 0.0)
-        payload.setdefault("crop_right", 1.0)
-        payload.setdefault("crop_bottom", 1.0)
+        if "split_ratios" not in data:
+            payload["split_ratios"] = []  # fresh list, never the shared default
+        _intern_fields(payload, _CELL_INTERNED)
         
         # Drop legacy keys from removed features so older project files
         # still load on newer builds (nested layouts removed Apr 2026).
@@ -402,16 +404,26 @@ class Cell:
         
         # Resolve image path: try absolute first, then relative to project file
         if payload.get("image_path") and project_dir:
+            # Shared across one project load so repeated paths stat once.
+            if isfile_cache is None:
+                isfile_cache = {}
+
+            def _isfile(path):
+                ok = isfile_cache.get(path)
+                if ok is None:
+                    ok = isfile_cache[path] = os.path.isfile(path)
+                return ok
+
             abs_path = payload["image_path"]
             # If absolute path doesn't exist, try relative to project directory
-            if not os.path.isfile(abs_path):
+            if not _isfile(abs_path):
                 filename = os.path.basename(abs_path)
                 relative_path = os.path.join(project_dir, filename)
-                if os.path.isfile(relative_path):
+                if _isfile(relative_path):
                     payload["image_path"] = relative_path
         
         cell = cls(**payload)
-        cell.children = [Cell.from_dict(c, project_dir) for c in children_data]
+        cell.children = [Cell.from_dict(c, project_dir, isfile_cache) for c in children_data]
         cell.pip_items = [PiPItem.from_dict(p) for p in pip_items_data]
         return cell
 
@@ -555,6 +567,19 @@ class Project:
                 return found
         return None
 
+    def cells_by_id(self) -> Dict[str, Cell]:
+        """Map every cell id (nested sub-cells included) to its Cell in one walk.
+
+        Prefer this over repeated find_cell_by_id() calls when resolving many ids.
+        """
+        index: Dict[str, Cell] = {}
+        stack = list(self.cells)
+        while stack:
+            cell = stack.pop()
+            index.setdefault(cell.id, cell)
+            stack.extend(cell.children)
+        return index
+
     def find_size_group(self, group_id: str) -> Optional[SizeGroup]:
         for g in self.size_groups:
             if g.id == group_id:
@@ -650,10 +675,22 @@ class Project:
         p.row_alignment = data.get("row_alignment", "center")
         
         p.rows = [RowTemplate.from_dict(r) for r in data.get("rows", [])]
-        p.cells = [Cell.from_dict(c, project_dir) for c in data.get("cells", [])]
+        isfile_cache: Dict[str, bool] = {}
+        p.cells = [Cell.from_dict(c, project_dir, isfile_cache) for c in data.get("cells", [])]
         p.size_groups = [SizeGroup.from_dict(g) for g in data.get("size_groups", [])]
         p.svg_text_groups = [SvgTextGroup.from_dict(g) for g in data.get("svg_text_groups", [])]
-        p.text_items = [TextItem.from_dict(t) for t in data.get("text_items", [])]
+        # Cell-scoped labels saved without an anchor get the project default
+        # as they are built, instead of in a second pass over all text items.
+        default_label_anchor = data.get("label_anchor", LabelPosition.TOP_LEFT.value) \
+            or LabelPosition.TOP_LEFT.value
+        if not default_label_anchor.endswith("_inside"):
+            default_label_anchor = f"{default_label_anchor}_inside"
+        p.text_items = []
+        for t_data in data.get("text_items", []):
+            t = TextItem.from_dict(t_data)
+            if not t.anchor and t.parent_id and t.scope == "cell":
+                t.anchor = default_label_anchor
+            p.text_items.append(t)
 
         # Prune orphan group references (group deleted but cell still refers to it)
         valid_group_ids = {g.id for g in p.size_groups}
@@ -687,18 +724,15 @@ class Project:
         p.corner_label_font_weight = data.get("corner_label_font_weight", "bold")
         p.corner_label_color = data.get("corner_label_color", "#000000")
 
-        default_label_anchor = p.label_anchor or LabelPosition.TOP_LEFT.value
-        if not default_label_anchor.endswith("_inside"):
-            default_label_anchor = f"{default_label_anchor}_inside"
-        for t in p.text_items:
-            if t.scope == "cell" and t.parent_id and not t.anchor:
-                t.anchor = default_label_anchor
-
         return p
 
     def save_to_file(self, filepath: str):
+        # json.dump() with indent writes one tiny chunk per token; encode the
+        # whole document first and hand the file a single write. to_dict()
+        # builds a fresh tree with no cycles, so skip the cycle bookkeeping.
+        text = json.dumps(self.to_dict(), indent=4, check_circular=False)
         with open(filepath, 'w', encoding='utf-8') as f:
-            json.dump(self.to_dict(), f, indent=4)
+            f.write(text)
 
     @classmethod
     def load_from_file(cls, filepath: str) -> 'Project':
@@ -1,8 +1,27 @@
 from dataclasses import dataclass, field
+from functools import lru_cache
 from typing import List, Dict, Tuple
 from .data_model import Project, Cell, RowTemplate
 
-@dataclass
+
+@lru_cache(maxsize=128)
+def _col_widths_cached(col_count: int, ratios: Tuple[float, ...],
+                       content_width: float, gap_mm: float) -> Tuple[float, ...]:
+    """Column widths for *col_count* columns; empty *ratios* means equal columns."""
+    total_horizontal_gaps = (col_count - 1) * gap_mm if col_count > 1 else 0
+    available_width = content_width - total_horizontal_gaps
+
+    if not ratios:
+        # Equal columns (the common case): one width, no ratio sums.
+        # Written as ratio/total * width to stay bit-identical to below.
+        return ((1.0 / col_count) * available_width,) * col_count
+
+    total_ratio = sum(ratios)
+    if total_ratio <= 0:
+        total_ratio = col_count
+    return tuple((r / total_ratio) * available_width for r in ratios)
+
+@dataclass(slots=True)
 class LayoutResult:
     cell_rects: Dict[str, Tuple[float, float, float, float]]
     row_heights: Dict[int, float]
@@ -24,23 +43,20 @@ class LayoutEngine:
         return max(5.0, min(50.0, w))
 
     @staticmethod
-    def _compute_col_widths(r_temp: RowTemplate, content_width: float, gap_mm: float) -> List[float]:
-        """Compute column widths for a row template."""
+    def _compute_col_widths(r_temp: RowTemplate, content_width: float, gap_mm: float) -> Tuple[float, ...]:
+        """Compute column widths for a row template (read-only tuple, memoised)."""
         col_count = r_temp.column_count
         if col_count <= 0:
-            return []
-        total_horizontal_gaps = (col_count - 1) * gap_mm if col_count > 1 else 0
-        available_width = content_width - total_horizontal_gaps
+            return ()
 
-        col_ratios = r_temp.column_ratios if r_temp.column_ratios else [1.0] * col_count
-        while len(col_ratios) < col_count:
-            col_ratios.append(1.0)
-        col_ratios = col_ratios[:col_count]
-
-        total_ratio = sum(col_ratios)
-        if total_ratio <= 0:
-            total_ratio = col_count
-        return [(r / total_ratio) * available_width for r in col_ratios]
+        col_ratios = r_temp.column_ratios
+        if col_ratios:
+            while len(col_ratios) < col_count:
+                col_ratios.append(1.0)
+            col_ratios = tuple(col_ratios[:col_count])
+        else:
+            col_ratios = ()
+        return _col_widths_cached(col_count, col_ratios, content_width, gap_mm)
 
     @staticmethod
     def calculate_freeform_layout(project: Project) -> LayoutResult:
@@ -65,7 +81,7 @@ class LayoutEngine:
                 LayoutEngine._layout_subcells(cell, parent_rect, project.gap_mm,
                                               sub_rects, sub_label, set(), False, 0.0)
                 cell_rects.update(sub_rects)
-        return LayoutResult(cell_rects=cell_rects, row_heights={}, figure_rects=dict(cell_rects))
+        return LayoutResult(cell_rects=cell_rects, row_heights={}, figure_rects=cell_rects)
 
     @staticmethod
     def calculate_layout(project: Project) -> LayoutResult:
@@ -77,9 +93,11 @@ class LayoutEngine:
             return LayoutEngine.calculate_freeform_layout(project)
 
         gap_mm = project.gap_mm
+        margin_left = project.margin_left_mm
+        cells = project.cells
         
         # 1. Calculate content area
-        content_width = project.page_width_mm - project.margin_left_mm - project.margin_right_mm
+        content_width = project.page_width_mm - margin_left - project.margin_right_mm
         content_height = project.page_height_mm - project.margin_top_mm - project.margin_bottom_mm
         
         if content_width <= 0 or content_height <= 0:
@@ -114,12 +132,13 @@ class LayoutEngine:
         labeled_cell_ids: set = set()
         rows_with_labels: set = set()
         if out_of_cell:
-            for t in project.text_items:
-                if t.scope == 'cell' and getattr(t, 'subtype', None) != 'corner' and t.parent_id:
-                    labeled_cell_ids.add(t.parent_id)
-            for c in project.cells:
-                if c.id in labeled_cell_ids:
-                    rows_with_labels.add(c.row_index)
+            labeled_cell_ids = {t.parent_id for t in project.text_items
+                                if t.scope == 'cell' and t.subtype != 'corner' and t.parent_id}
+            rows_with_labels = {c.row_index for c in cells if c.id in labeled_cell_ids}
+            if not labeled_cell_ids:
+                # Nothing is numbered: every per-cell label branch below is dead.
+                label_row_above = label_row_below = False
+                label_col_left = label_col_right = False
 
         # 3. Calculate row heights
         # Subtract vertical gaps between rows.
@@ -171,7 +190,7 @@ class LayoutEngine:
         
         # Calculate standard column width for fixed grid mode
         max_col_count = max((r.column_count for r in row_templates), default=1)
-        standard_col_widths = []
+        standard_col_widths: Tuple[float, ...] = ()
         if grid_mode == "fixed" and max_col_count > 0:
             # Create a dummy row template with max columns to compute standard widths
             # We assume all rows in fixed mode share the column ratios of the widest row
@@ -182,7 +201,13 @@ class LayoutEngine:
         # 5. Calculate cell rectangles and label cell rectangles
         cell_rects = {}
         label_rects: Dict[str, Tuple[float, float, float, float]] = {}
-        
+
+        # Bucket top-level cells by row once instead of rescanning every
+        # cell for each row (keeps each row's original cell order).
+        cells_by_row: Dict[int, List] = {}
+        for c in cells:
+            cells_by_row.setdefault(c.row_index, []).append(c)
+
         for lbl_y, lbl_h, pic_y, pic_h, r_temp in calculated_row_geometries:
             col_count = r_temp.column_count
             if col_count <= 0:
@@ -195,27 +220,27 @@ class LayoutEngine:
                 
                 # Apply row alignment offset
                 if row_alignment == "left":
-                    x_offset = project.margin_left_mm
+                    x_offset = margin_left
                 elif row_alignment == "right":
-                    x_offset = project.margin_left_mm + content_width - row_width
+                    x_offset = margin_left + content_width - row_width
                 else: # center (default)
-                    x_offset = project.margin_left_mm + (content_width - row_width) / 2.0
+                    x_offset = margin_left + (content_width - row_width) / 2.0
             else:
                 # Stretch mode (default behavior)
                 col_widths = LayoutEngine._compute_col_widths(r_temp, content_width, gap_mm)
-                x_offset = project.margin_left_mm
+                x_offset = margin_left
                 row_width = content_width
 
-            row_cells = [c for c in project.cells if c.row_index == r_temp.index]
-            
-            for cell in row_cells:
+            # Left edge of every column, as a running sum computed once per row.
+            col_x = [x_offset]
+            for w in col_widths[:-1]:
+                col_x.append(col_x[-1] + (w + gap_mm))
+
+            for cell in cells_by_row.get(r_temp.index, ()):
                 if cell.col_index >= col_count:
                     continue
-                
-                x_pos = x_offset
-                for i in range(cell.col_index):
-                    x_pos += col_widths[i] + gap_mm
-                
+
+                x_pos = col_x[cell.col_index]
                 col_w = col_widths[cell.col_index]
 
                 # Reserve a label strip on the left or right edge of the picture cell.
@@ -249,7 +274,9 @@ class LayoutEngine:
                         labeled_cell_ids, label_row_above, label_row_h
                     )
 
-        figure_rects: Dict[str, Tuple[float, float, float, float]] = dict(cell_rects)
+        # figure_rects aliases cell_rects: overrides below land in both, so a
+        # copy would only ever hold the same tuples.
+        figure_rects: Dict[str, Tuple[float, float, float, float]] = cell_rects
 
         # Apply grid size overrides (including size-group resolution)
         if getattr(project, 'layout_mode', 'grid') == 'grid':
@@ -288,7 +315,6 @@ class LayoutEngine:
                             fy = sy + (sh - fh) / 2.0
                             
                         cell_rects[cell.id] = (fx, fy, fw, fh)
-                        figure_rects[cell.id] = (fx, fy, fw, fh)
 
         # Compute row bounding rects (include label row above if present)
         row_rects: Dict[int, Tuple[float, float, float, float]] = {}
@@ -300,13 +326,13 @@ class LayoutEngine:
                 col_widths = standard_col_widths[:col_count]
                 row_width = sum(col_widths) + (col_count - 1) * gap_mm if col_count > 1 else sum(col_widths)
                 if row_alignment == "left":
-                    x_offset = project.margin_left_mm
+                    x_offset = margin_left
                 elif row_alignment == "right":
-                    x_offset = project.margin_left_mm + content_width - row_width
+                    x_offset = margin_left + content_width - row_width
                 else: # center
-                    x_offset = project.margin_left_mm + (content_width - row_width) / 2.0
+                    x_offset = margin_left + (content_width - row_width) / 2.0
             else:
-                x_offset = project.margin_left_mm
+                x_offset = margin_left
                 row_width = content_width
 
             if _lbl_y is not None:
@@ -349,8 +375,15 @@ class LayoutEngine:
         # Pre-compute natural sizes per group (for program-controlled shared sizing).
         group_natural_min_w: Dict[str, float] = {}
         group_natural_min_h: Dict[str, float] = {}
+        leaf_cells = project.get_all_leaf_cells()
+        groups_by_id = {g.id: g for g in groups}
+        members_by_group: Dict[str, list] = {}
+        for c in leaf_cells:
+            gid = getattr(c, 'size_group_id', None)
+            if gid:
+                members_by_group.setdefault(gid, []).append(c)
         for g in groups:
-            members = [c for c in project.get_all_leaf_cells() if c.size_group_id == g.id]
+            members = members_by_group.get(g.id, [])
             ws, hs = [], []
             for m in members:
                 if m.id in natural_cell_rects:
@@ -363,10 +396,10 @@ class LayoutEngine:
             group_natural_min_h[g.id] = min(hs) if hs else 0.0
 
         # Resolve per-cell effective overrides.
-        for cell in project.get_all_leaf_cells():
+        for cell in leaf_cells:
             gid = getattr(cell, 'size_group_id', None)
             if gid:
-                g = next((x for x in groups if x.id == gid), None)
+                g = groups_by_id.get(gid)
                 if g is None:
                     # Orphan reference: fall back to per-cell.
                     result[cell.id] = (
@@ -395,103 +428,110 @@ class LayoutEngine:
         label_row_above: bool,
         label_row_h: float,
     ):
-        """Recursively compute geometry for sub-cells within a parent cell."""
-        children = parent_cell.children
-        if not children:
-            return
-
-        px, py, pw, ph = parent_rect
-        n = len(children)
-        ratios = list(parent_cell.split_ratios) if parent_cell.split_ratios else [1.0] * n
-        while len(ratios) < n:
-            ratios.append(1.0)
-        ratios = ratios[:n]
-        total_ratio = sum(ratios)
-        if total_ratio <= 0:
-            total_ratio = float(n)
-
-        total_gap = (n - 1) * gap_mm if n > 1 else 0.0
-
-        if parent_cell.split_direction == "vertical":
-            # --- Vertical stacking: divide height ---
-            # Account for label rows above leaf children and fixed-height children.
-            label_space = 0.0
-            fixed_h_total = 0.0
-            ratio_sum = 0.0
-            for i, child in enumerate(children):
-                if label_row_above and child.id in labeled_cell_ids:
-                    label_space += label_row_h + gap_mm
-                oh = getattr(child, 'override_height_mm', 0.0)
-                if oh > 0:
-                    fixed_h_total += oh
-                else:
-                    ratio_sum += ratios[i]
-            if ratio_sum <= 0:
-                ratio_sum = 1.0
-
-            available = ph - total_gap - label_space - fixed_h_total
-            if available < 0:
-                available = 0
-            current_y = py
-            for i, child in enumerate(children):
-                # Label rect for this child (above it)
-                if label_row_above and child.id in labeled_cell_ids:
-                    label_rects[child.id] = (px, current_y, pw, label_row_h)
-                    current_y += label_row_h + gap_mm
-
-                oh = getattr(child, 'override_height_mm', 0.0)
-                child_h = oh if oh > 0 else (ratios[i] / ratio_sum) * available
-                child_rect = (px, current_y, pw, child_h)
-                cell_rects[child.id] = child_rect
-
-                if not child.is_leaf:
-                    LayoutEngine._layout_subcells(
-                        child, child_rect, gap_mm, cell_rects,
-                        label_rects, labeled_cell_ids, label_row_above, label_row_h
-                    )
-                current_y += child_h + gap_mm
-
-        elif parent_cell.split_direction == "horizontal":
-            # --- Horizontal stacking: divide width ---
-            # Account for fixed-width children; ratio children share the remainder.
-            fixed_w_total = 0.0
-            ratio_sum = 0.0
-            for i, child in enumerate(children):
-                ow = getattr(child, 'override_width_mm', 0.0)
-                if ow > 0:
-                    fixed_w_total += ow
-                else:
-                    ratio_sum += ratios[i]
-            if ratio_sum <= 0:
-                ratio_sum = 1.0
-
-            available = max(0.0, pw - total_gap - fixed_w_total)
-
-            # If any direct leaf child is labeled, reserve a label strip at the
-            # top of the shared height band.  All children must start at the same
-            # y, so the overhead applies to every child once any one needs it.
-            any_labeled_leaf = label_row_above and any(
-                child.id in labeled_cell_ids for child in children
-            )
-            label_overhead = (label_row_h + gap_mm) if any_labeled_leaf else 0.0
-            img_py = py + label_overhead
-            img_ph = max(0.0, ph - label_overhead)
-
-            current_x = px
-            for i, child in enumerate(children):
-                ow = getattr(child, 'override_width_mm', 0.0)
-                child_w = ow if ow > 0 else (ratios[i] / ratio_sum) * available
-
-                # Label rect: spans the child's width, sits in the reserved strip
-                if label_row_above and child.id in labeled_cell_ids:
-                    label_rects[child.id] = (current_x, py, child_w, label_row_h)
-
-                child_rect = (current_x, img_py, child_w, img_ph)
-                cell_rects[child.id] = child_rect
-
-                if not child.is_leaf:
-                    LayoutEngine._layout_subcells(
-                        child, child_rect, gap_mm, cell_rects,
-                        label_rects, labeled_cell_ids, label_row_above, label_row_h
-                    )
-                current_x += child_w + gap_mm
+        """Compute geometry for sub-cells within a parent cell.
+
+        Walks the split tree with an explicit stack instead of recursing.
+        Each entry is (cell, rect, label_rect, emit); children are pushed in
+        reverse so rects are recorded in the same pre-order as a recursive walk.
+        """
+        stack = [(parent_cell, parent_rect, None, False)]
+        while stack:
+            cell, rect, lbl_rect, emit = stack.pop()
+            if emit:
+                if lbl_rect is not None:
+                    label_rects[cell.id] = lbl_rect
+                cell_rects[cell.id] = rect
+                if cell.is_leaf:
+                    continue
+
+            children = cell.children
+            if not children:
+                continue
+
+            px, py, pw, ph = rect
+            n = len(children)
+            ratios = list(cell.split_ratios) if cell.split_ratios else [1.0] * n
+            while len(ratios) < n:
+                ratios.append(1.0)
+            ratios = ratios[:n]
+            total_ratio = sum(ratios)
+            if total_ratio <= 0:
+                total_ratio = float(n)
+
+            total_gap = (n - 1) * gap_mm if n > 1 else 0.0
+            placed = []
+
+            if cell.split_direction == "vertical":
+                # --- Vertical stacking: divide height ---
+                # Account for label rows above leaf children and fixed-height children.
+                label_space = 0.0
+                fixed_h_total = 0.0
+                ratio_sum = 0.0
+                for i, child in enumerate(children):
+                    if label_row_above and child.id in labeled_cell_ids:
+                        label_space += label_row_h + gap_mm
+                    oh = getattr(child, 'override_height_mm', 0.0)
+                    if oh > 0:
+                        fixed_h_total += oh
+                    else:
+                        ratio_sum += ratios[i]
+                if ratio_sum <= 0:
+                    ratio_sum = 1.0
+
+                available = ph - total_gap - label_space - fixed_h_total
+                if available < 0:
+                    available = 0
+                current_y = py
+                for i, child in enumerate(children):
+                    # Label rect for this child (above it)
+                    child_lbl = None
+                    if label_row_above and child.id in labeled_cell_ids:
+                        child_lbl = (px, current_y, pw, label_row_h)
+                        current_y += label_row_h + gap_mm
+
+                    oh = getattr(child, 'override_height_mm', 0.0)
+                    child_h = oh if oh > 0 else (ratios[i] / ratio_sum) * available
+                    placed.append((child, (px, current_y, pw, child_h), child_lbl, True))
+                    current_y += child_h + gap_mm
+
+            elif cell.split_direction == "horizontal":
+                # --- Horizontal stacking: divide width ---
+                # Account for fixed-width children; ratio children share the remainder.
+                fixed_w_total = 0.0
+                ratio_sum = 0.0
+                for i, child in enumerate(children):
+                    ow = getattr(child, 'override_width_mm', 0.0)
+                    if ow > 0:
+                        fixed_w_total += ow
+                    else:
+                        ratio_sum += ratios[i]
+                if ratio_sum <= 0:
+                    ratio_sum = 1.0
+
+                available = max(0.0, pw - total_gap - fixed_w_total)
+
+                # If any direct leaf child is labeled, reserve a label strip at the
+                # top of the shared height band.  All children must start at the same
+                # y, so the overhead applies to every child once any one needs it.
+                any_labeled_leaf = label_row_above and any(
+                    child.id in labeled_cell_ids for child in children
+                )
+                label_overhead = (label_row_h + gap_mm) if any_labeled_leaf else 0.0
+                img_py = py + label_overhead
+                img_ph = max(0.0, ph - label_overhead)
+
+                current_x = px
+                for i, child in enumerate(children):
+                    ow = getattr(child, 'override_width_mm', 0.0)
+                    child_w = ow if ow > 0 else (ratios[i] / ratio_sum) * available
+
+                    # Label rect: spans the child's width, sits in the reserved strip
+                    child_lbl = None
+                    if label_row_above and child.id in labeled_cell_ids:
+                        child_lbl = (current_x, py, child_w, label_row_h)
+
+                    placed.append((child, (current_x, img_py, child_w, img_ph), child_lbl, True))
+                    current_x += child_w + gap_mm
+
+            placed.reverse()
+            stack.extend(placed)
@@ -6,6 +6,7 @@ Register migrations in MIGRATIONS as (from_version, to_version, function).
 They are applied sequentially when loading an older file.
 """
 
+from bisect import bisect_right
 from typing import Dict, Any, List, Tuple, Callable
 
 from src.version import APP_VERSION
@@ -40,6 +41,15 @@ MIGRATIONS: List[Tuple[str | None, str, Callable[[Dict[str, Any]], Dict[str, Any
     (None, "1.0.0", _migrate_none_to_1_0_0),
 ]
 
+# MIGRATIONS with the target version pre-parsed and ordered by it (stable, so
+# registration order breaks ties), plus the bare targets for bisecting: a
+# tagged file starts at the first step that is newer than it.
+_PARSED_MIGRATIONS = sorted(((from_ver, to_ver, _ver(to_ver), func)
+                             for from_ver, to_ver, func in MIGRATIONS),
+                            key=lambda m: m[2])
+_MIGRATION_TARGETS = [m[2] for m in _PARSED_MIGRATIONS]
+_APP_VER = _ver(APP_VERSION)
+
 
 def migrate_project_data(data: Dict[str, Any]) -> Dict[str, Any]:
     """
@@ -47,23 +57,37 @@ def migrate_project_data(data: Dict[str, Any]) -> Dict[str, Any]:
     Returns the (mutated) data dict with ``file_version`` set to APP_VERSION.
     """
     file_ver_str = data.get("file_version", None)
-    target = _ver(APP_VERSION)
+    file_ver = None
+    if file_ver_str is not None:
+        try:
+            file_ver = _ver(file_ver_str)
+        except (ValueError, AttributeError):
+            # Tagged but unparsable ("", "1.0-beta", ...): treat it as older
+            # than every tagged step, but still skip the untagged-file step.
+            file_ver = ()
+    target = _APP_VER
+
+    # Already current (the usual case): nothing to walk.
+    if file_ver is not None and file_ver >= target:
+        data["file_version"] = APP_VERSION
+        return data
 
-    for from_ver, to_ver, func in MIGRATIONS:
+    start = 0 if file_ver is None else bisect_right(_MIGRATION_TARGETS, file_ver)
+    for from_ver, to_ver, to_tuple, func in _PARSED_MIGRATIONS[start:]:
         # Determine whether this migration step should run
         if from_ver is None:
             # Applies only when the file has no version tag
-            if file_ver_str is not None:
+            if file_ver is not None:
                 continue
         else:
-            if file_ver_str is not None and _ver(file_ver_str) >= _ver(to_ver):
+            if file_ver is not None and file_ver >= to_tuple:
                 continue
 
         data = func(data)
         data["file_version"] = to_ver
-        file_ver_str = to_ver
+        file_ver = to_tuple
 
-        if _ver(to_ver) >= target:
+        if to_tuple >= target:
             break
 
     # Stamp current version
@@ -0,0 +1,85 @@
+"""
+Persistent image-size cache for Auto Layout.
+
+Remembers the stored (width, height) of image files in a small JSON file under
+the user's home directory, keyed by absolute path and validated against the
+file's mtime and byte size.  Re-running Auto Layout on an unchanged project
+then needs one ``os.stat`` per image instead of opening every file.
+
+Only raw pixel sizes are stored; crop and rotation are applied by the caller,
+so editing a cell never invalidates an entry.
+"""
+
+import json
+import os
+import threading
+from typing import Callable, Dict, List, Tuple
+
+_CACHE_PATH = os.path.join(os.path.expanduser("~"), ".imagelayoutmanager", "aspect_cache.json")
+
+# Oldest entries are dropped beyond this when the cache is written back.
+_MAX_ENTRIES = 4096
+
+_entries: Dict[str, List[int]] = {}  # abspath -> [mtime_ns, size, width, height]
+_loaded = False
+_dirty = False
+_lock = threading.Lock()
+
+
+def _load() -> None:
+    global _loaded
+    _loaded = True
+    if not os.path.exists(_CACHE_PATH):
+        return
+    try:
+        with open(_CACHE_PATH, "r", encoding="utf-8") as f:
+            data = json.load(f)
+        for path, entry in data.get("entries", {}).items():
+            if isinstance(entry, list) and len(entry) == 4:
+                _entries[path] = entry
+    except Exception:
+        pass
+
+
+def get_size(path: str, loader: Callable[[str], Tuple[int, int]]) -> Tuple[int, int]:
+    """Return (width, height) for *path*, calling *loader* only on a cache miss.
+
+    Exceptions from ``os.stat`` or *loader* propagate to the caller.
+    """
+    global _dirty
+    key = os.path.abspath(path)
+    st = os.stat(key)
+    with _lock:
+        if not _loaded:
+            _load()
+        entry = _entries.get(key)
+        if entry is not None and entry[0] == st.st_mtime_ns and entry[1] == st.st_size:
+            return entry[2], entry[3]
+
+    w, h = loader(path)
+
+    with _lock:
+        _entries.pop(key, None)  # re-insert at the end: most recently used
+        _entries[key] = [st.st_mtime_ns, st.st_size, int(w), int(h)]
+        _dirty = True
+    return w, h
+
+
+def flush() -> None:
+    """Write the cache back to disk if anything changed since the last flush."""
+    global _dirty
+    with _lock:
+        if not _dirty:
+            return
+        while len(_entries) > _MAX_ENTRIES:
+            del _entries[next(iter(_entries))]
+        payload = {"entries": dict(_entries)}
+        _dirty = False
+    try:
+        os.makedirs(os.path.dirname(_CACHE_PATH), exist_ok=True)
+        tmp_path = _CACHE_PATH + ".tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(payload, f)
+        os.replace(tmp_path, _CACHE_PATH)
+    except Exception as e:
+        print(f"Could not write aspect cache: {e}")
@@ -27,23 +27,27 @@ def _spatial_key(cell, rects):
     return (round(y / _Y_TOL), x)
 
 
-def _label_text(index: int, start_char: str, use_parens: bool) -> str:
-    text = chr(ord(start_char) + index)
-    return f"({text})" if use_parens else text
+def _label_texts(count: int, start_char: str, use_parens: bool) -> list:
+    """All *count* label strings in sequence, e.g. ['(a)', '(b)', ...]."""
+    base = ord(start_char)
+    if use_parens:
+        return [f"({chr(base + i)})" for i in range(count)]
+    return [chr(base + i) for i in range(count)]
 
 
-def _make_label(cell, text: str, project: Project, rects: dict):
+def _make_label(cell, text: str, style: tuple, rects: dict):
+    """Build a numbering TextItem; *style* is (family, size_pt, weight, color)."""
     if cell.id not in rects:
         return None
     x, y, _w, _h = rects[cell.id]
     offset = 2.0
-    font_size = project.label_font_size if project.label_font_size > 0 else 10.0
+    font_family, font_size, font_weight, color = style
     return TextItem(
         text=text,
-        font_family=project.label_font_family,
+        font_family=font_family,
         font_size_pt=font_size,
-        font_weight=project.label_font_weight,
-        color=project.label_color,
+        font_weight=font_weight,
+        color=color,
         x=x + offset,
         y=y + offset,
         scope="cell",
@@ -64,6 +68,9 @@ class AutoLabel:
         sequence — matching the convention that sub-panels are lettered before
         their composite parent.
         """
+        if not project.cells:
+            return  # nothing to label; skip the layout pass entirely
+
         layout = LayoutEngine.calculate_layout(project)
         rects = layout.cell_rects
 
@@ -80,7 +87,17 @@ class AutoLabel:
         start_char = 'A' if 'A' in project.label_scheme else 'a'
         use_parens = '(' in project.label_scheme
 
-        for i, cell in enumerate(leaves + branches):
-            item = _make_label(cell, _label_text(i, start_char, use_parens), project, rects)
+        # Label style is the same for every panel: resolve it once.
+        font_size = project.label_font_size if project.label_font_size > 0 else 10.0
+        style = (project.label_font_family, font_size,
+                 project.label_font_weight, project.label_color)
+
+        ordered = leaves + branches
+        texts = _label_texts(len(ordered), start_char, use_parens)
+
+        new_items = []
+        for cell, text in zip(ordered, texts):
+            item = _make_label(cell, text, style, rects)
             if item:
-                project.text_items.append(item)
+                new_items.append(item)
+        project.text_items.extend(new_items)
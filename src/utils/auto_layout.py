@@ -1,58 +1,184 @@
 import os
-from typing import List, Tuple, Dict
+import re
+import struct
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Tuple, Dict, Optional
 from PIL import Image
 from PyQt6.QtSvg import QSvgRenderer
 from src.model.data_model import Project, RowTemplate, Cell
+from src.utils import aspect_cache
+
+
+def _fast_image_size(path: str) -> Tuple[int, int]:
+    """Return the stored (width, height) of a raster image.
+
+    PNG, GIF and BMP keep their dimensions at a fixed offset in the first
+    few bytes, so those are read straight from the header without handing
+    the file to Pillow. Everything else (JPEG, TIFF, WebP, ...) falls back
+    to ``Image.open``, which also stops after the header.
+    """
+    with open(path, 'rb') as f:
+        head = f.read(26)
+    if head[:8] == b'\x89PNG\r\n\x1a\n' and head[12:16] == b'IHDR':
+        return struct.unpack('>II', head[16:24])
+    if head[:6] in (b'GIF87a', b'GIF89a'):
+        return struct.unpack('<HH', head[6:10])
+    if head[:2] == b'BM' and len(head) >= 26:
+        dib_size = struct.unpack('<I', head[14:18])[0]
+        if dib_size == 12:
+            return struct.unpack('<HH', head[18:22])
+        if dib_size >= 40:
+            w, h = struct.unpack('<ii', head[18:26])
+            return (w, abs(h))
+    with Image.open(path) as img:
+        return img.size
+
+
+_SVG_ROOT_RE = re.compile(rb'<svg\b[^>]*>', re.S)
+_SVG_ATTR_RE = re.compile(rb'\s(width|height|viewBox)\s*=\s*["\']([^"\']*)["\']')
+_SVG_LENGTH_RE = re.compile(rb'^\s*([0-9.]+(?:[eE][-+]?[0-9]+)?)\s*([a-z]*)\s*$')
+
+
+def _svg_size(path: str) -> Optional[Tuple[float, float]]:
+    """Intrinsic (width, height) from the root <svg> tag, or None if unclear.
+
+    Mirrors QSvgRenderer.defaultSize() for the common cases without building
+    a paint tree: explicit width/height in the same unit win, otherwise the
+    viewBox extent is used. Anything else (percentages, mixed units, a root
+    tag beyond the first 4 KB) returns None so the caller can ask Qt.
+    """
+    with open(path, 'rb') as f:
+        head = f.read(4096)
+    m = _SVG_ROOT_RE.search(head)
+    if m is None:
+        return None
+    attrs = dict(_SVG_ATTR_RE.findall(m.group(0)))
+    w = _SVG_LENGTH_RE.match(attrs.get(b'width', b''))
+    h = _SVG_LENGTH_RE.match(attrs.get(b'height', b''))
+    if w and h and w.group(2) == h.group(2):
+        return float(w.group(1)), float(h.group(1))
+    if w or h or b'width' in attrs or b'height' in attrs:
+        return None
+    box = attrs.get(b'viewBox', b'').replace(b',', b' ').split()
+    if len(box) != 4:
+        return None
+    try:
+        return float(box[2]), float(box[3])
+    except ValueError:
+        return None
+
+
+# (abspath, mtime_ns) -> first-page (width, height) in points, or None when
+# the PDF has no pages. The mtime in the key retires entries for edited files.
+_pdf_size_cache: Dict[Tuple[str, int], Optional[Tuple[float, float]]] = {}
+
+
+def _pdf_page_size(path: str) -> Optional[Tuple[float, float]]:
+    """First-page size of a PDF, opening it with PyMuPDF only once per version."""
+    key = (os.path.abspath(path), os.stat(path).st_mtime_ns)
+    if key in _pdf_size_cache:
+        return _pdf_size_cache[key]
+    try:
+        import fitz
+    except ImportError:
+        return None
+    doc = fitz.open(path)
+    try:
+        size = None
+        if doc.page_count > 0:
+            rect = doc[0].rect
+            size = (rect.width, rect.height)
+    finally:
+        doc.close()
+    _pdf_size_cache[key] = size
+    return size
+
+
+def _svg_probe_size(path: str) -> Optional[Tuple[float, float]]:
+    """SVG size from the root-tag attributes, else from QSvgRenderer."""
+    size = _svg_size(path)
+    if size is None:
+        renderer = QSvgRenderer(path)
+        if not renderer.isValid():
+            return None
+        qsize = renderer.defaultSize()
+        size = (qsize.width(), qsize.height())
+    return size
+
+
+# Vector formats with their own size probe; any other extension is treated
+# as a raster and measured via the on-disk cache + header probe.
+_VECTOR_SIZE_LOADERS = {
+    '.svg': _svg_probe_size,
+    '.pdf': _pdf_page_size,
+}
+
+
+def _probe_size(path: str, ext: str) -> Optional[Tuple[float, float]]:
+    """Native (width, height) of the image at *path*, or None if unreadable."""
+    try:
+        loader = _VECTOR_SIZE_LOADERS.get(ext)
+        if loader is not None:
+            return loader(path)
+        # Raster formats: header-only size probe, cached on disk
+        return aspect_cache.get_size(path, _fast_image_size)
+    except Exception:
+        return None
+
+
+def _cell_aspect(cell, ext: str, size: Optional[Tuple[float, float]]) -> Optional[float]:
+    """w/h of *cell*'s image from its native *size*, after crop and rotation."""
+    if size is None or size[1] <= 0:
+        return None
+    if ext in _VECTOR_SIZE_LOADERS:
+        ratio = size[0] / size[1]
+    else:
+        crop_w = max(0.001, cell.crop_right - cell.crop_left)
+        crop_h = max(0.001, cell.crop_bottom - cell.crop_top)
+        ratio = (size[0] * crop_w) / (size[1] * crop_h)
+    # Adjust ratio if rotated 90 or 270 degrees
+    if cell.rotation in (90, 270):
+        ratio = 1.0 / ratio if ratio != 0 else 0
+    return ratio
+
+
+def _gather_aspect_ratios(cells) -> Dict[str, float]:
+    """cell_id -> native aspect for every leaf cell with a readable image.
+
+    Each distinct image path is probed once, however many cells show it;
+    crop and rotation are then applied per cell. Raster probes are
+    independent stat/header reads, so two or more run on a thread pool of at
+    most one worker per CPU (a lone path is probed inline); SVG and PDF
+    probes stay on the calling thread (PyMuPDF is not thread-safe). There is
+    no separate exists() pass: a probe's own stat/open fails for a missing
+    file and the cell is simply skipped.
+    """
+    probes = [(c, os.path.splitext(c.image_path)[1].lower()) for c in cells
+              if c.image_path and not c.is_placeholder]
+    unique = {c.image_path: ext for c, ext in probes}
+    raster = [path for path, ext in unique.items() if ext not in _VECTOR_SIZE_LOADERS]
+    sizes: Dict[str, Optional[Tuple[float, float]]] = {}
+    if len(raster) > 1:
+        workers = min(len(raster), os.cpu_count() or 4)
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            sizes = dict(zip(raster, pool.map(_probe_size, raster, [unique[p] for p in raster])))
+    for path, ext in unique.items():
+        if path not in sizes:
+            sizes[path] = _probe_size(path, ext)
+    aspect_cache.flush()
+
+    aspect_ratios = {}
+    for cell, ext in probes:
+        ratio = _cell_aspect(cell, ext, sizes[cell.image_path])
+        if ratio is not None:
+            aspect_ratios[cell.id] = ratio
+    return aspect_ratios
 
 class AutoLayout:
     @staticmethod
     def _get_image_aspect_ratios(project: Project) -> Dict[str, float]:
         """Extracts the native w/h aspect ratio for all images in the project."""
-        aspect_ratios = {}
-        for cell in project.get_all_leaf_cells():
-            if cell.image_path and os.path.exists(cell.image_path) and not cell.is_placeholder:
-                try:
-                    ext = os.path.splitext(cell.image_path)[1].lower()
-                    if ext == '.svg':
-                        # Handle SVG vector format
-                        renderer = QSvgRenderer(cell.image_path)
-                        if renderer.isValid():
-                            size = renderer.defaultSize()
-                            if size.height() > 0:
-                                ratio = size.width() / size.height()
-                                if getattr(cell, 'rotation', 0) in [90, 270]:
-                                    ratio = 1.0 / ratio if ratio != 0 else 0
-                                aspect_ratios[cell.id] = ratio
-                    elif ext == '.pdf':
-                        # Handle PDF format with PyMuPDF
-                        try:
-                            import fitz
-                            doc = fitz.open(cell.image_path)
-                            if doc.page_count > 0:
-                                page = doc[0]
-                                rect = page.rect
-                                if rect.height > 0:
-                                    ratio = rect.width / rect.height
-                                    if getattr(cell, 'rotation', 0) in [90, 270]:
-                                        ratio = 1.0 / ratio if ratio != 0 else 0
-                                    aspect_ratios[cell.id] = ratio
-                            doc.close()
-                        except ImportError:
-                            pass
-                    else:
-                        # Handle raster formats with PIL
-                        with Image.open(cell.image_path) as img:
-                            w, h = img.size
-                            if h > 0:
-                                crop_w = max(0.001, getattr(cell, 'crop_right', 1.0) - getattr(cell, 'crop_left', 0.0))
-                                crop_h = max(0.001, getattr(cell, 'crop_bottom', 1.0) - getattr(cell, 'crop_top', 0.0))
-                                ratio = (w * crop_w) / (h * crop_h)
-                                if getattr(cell, 'rotation', 0) in [90, 270]:
-                                    ratio = 1.0 / ratio if ratio != 0 else 0
-                                aspect_ratios[cell.id] = ratio
-                except Exception:
-                    pass
-        return aspect_ratios
+        return _gather_aspect_ratios(project.get_all_leaf_cells())
 
     @staticmethod
     def optimize_layout(project: Project) -> Dict[str, any]:
@@ -73,62 +199,18 @@ class AutoLayout:
         """
         
         # 1. Gather image aspect ratios
-        aspect_ratios = {} # cell_id -> float (w/h)
-        
-        for cell in project.get_all_leaf_cells():
-            if cell.image_path and os.path.exists(cell.image_path) and not cell.is_placeholder:
-                try:
-                    ext = os.path.splitext(cell.image_path)[1].lower()
-                    if ext == '.svg':
-                        # Handle SVG vector format
-                        renderer = QSvgRenderer(cell.image_path)
-                        if renderer.isValid():
-                            size = renderer.defaultSize()
-                            if size.height() > 0:
-                                ratio = size.width() / size.height()
-                                # Adjust ratio if rotated 90 or 270 degrees
-                                if getattr(cell, 'rotation', 0) in [90, 270]:
-                                    ratio = 1.0 / ratio if ratio != 0 else 0
-                                aspect_ratios[cell.id] = ratio
-                    elif ext == '.pdf':
-                        # Handle PDF format with PyMuPDF
-                        try:
-                            import fitz
-                            doc = fitz.open(cell.image_path)
-                            if doc.page_count > 0:
-                                page = doc[0]
-                                rect = page.rect
-                                if rect.height > 0:
-                                    ratio = rect.width / rect.height
-                                    # Adjust ratio if rotated 90 or 270 degrees
-                                    if getattr(cell, 'rotation', 0) in [90, 270]:
-                                        ratio = 1.0 / ratio if ratio != 0 else 0
-                                    aspect_ratios[cell.id] = ratio
-                            doc.close()
-                        except ImportError:
-                            pass
-                    else:
-                        # Handle raster formats with PIL
-                        with Image.open(cell.image_path) as img:
-                            w, h = img.size
-                            if h > 0:
-                                crop_w = max(0.001, getattr(cell, 'crop_right', 1.0) - getattr(cell, 'crop_left', 0.0))
-                                crop_h = max(0.001, getattr(cell, 'crop_bottom', 1.0) - getattr(cell, 'crop_top', 0.0))
-                                ratio = (w * crop_w) / (h * crop_h)
-                                # Adjust ratio if rotated 90 or 270 degrees
-                                if getattr(cell, 'rotation', 0) in [90, 270]:
-                                    ratio = 1.0 / ratio if ratio != 0 else 0
-                                aspect_ratios[cell.id] = ratio
-                except Exception:
-                    pass
+        aspect_ratios = _gather_aspect_ratios(project.get_all_leaf_cells())  # cell_id -> float (w/h)
         
         # 1a-group. Size-group aware aspect bucketing.
         # Cells that belong to the same size group must end up with the same W/H.
         # Using the MIN aspect of the group ensures the shared size fits every member.
         groups = getattr(project, 'size_groups', []) or []
         if groups:
+            members_by_group: Dict[str, List[str]] = {}
+            for c in project.get_all_leaf_cells():
+                members_by_group.setdefault(c.size_group_id, []).append(c.id)
             for g in groups:
-                member_ids = [c.id for c in project.get_all_leaf_cells() if c.size_group_id == g.id]
+                member_ids = members_by_group.get(g.id, [])
                 aspects = [aspect_ratios[mid] for mid in member_ids if mid in aspect_ratios]
                 if aspects:
                     shared_aspect = min(aspects)
@@ -156,9 +238,9 @@ class AutoLayout:
             from src.model.layout_engine import LayoutEngine
             _custom_h = getattr(project, 'label_row_height', 0.0)
             _label_row_h = _custom_h if _custom_h > 0 else LayoutEngine._label_row_height_mm(project)
-            for t in project.text_items:
-                if t.scope == 'cell' and getattr(t, 'subtype', None) != 'corner' and t.parent_id:
-                    _labeled_cell_ids.add(t.parent_id)
+            # Single pass over text_items; step 4 reuses this set for label rows.
+            _labeled_cell_ids = {t.parent_id for t in project.text_items
+                                 if t.scope == 'cell' and t.subtype != 'corner' and t.parent_id}
 
         def _optimise_and_composite(cell, parent_w: float):
             """Return (w, total_h, img_h) for *cell* at width *parent_w*.
@@ -283,13 +365,15 @@ class AutoLayout:
         
         # We need to collect all row "height demands" first to normalize them later
         row_height_demands = {} # row_index -> float
+
+        # Bucket top-level cells by row once instead of rescanning per row
+        cells_by_row: Dict[int, List[Cell]] = {}
+        for c in project.cells:
+            cells_by_row.setdefault(c.row_index, []).append(c)
         
         for row in sorted_rows:
             # Find top-level cells in this row
-            row_cells = sorted(
-                [c for c in project.cells if c.row_index == row.index],
-                key=lambda c: c.col_index
-            )
+            row_cells = sorted(cells_by_row.get(row.index, ()), key=lambda c: c.col_index)
             
             col_count = row.column_count
             if col_count <= 0:
@@ -314,20 +398,20 @@ class AutoLayout:
             # But if there are *some* images, we should use their ratios, and average for placeholders
             if valid_aspects:
                 avg_aspect = sum(valid_aspects) / len(valid_aspects)
-                # Fill in placeholders with average aspect
-                final_ratios = []
-                for r in row_aspects:
-                    if r == 1.0 and 1.0 not in valid_aspects: # If it was a default placeholder
-                        final_ratios.append(avg_aspect)
-                    else:
-                        final_ratios.append(r)
+                # Fill in placeholders with average aspect. A 1.0 slot is a
+                # default placeholder only if no real image measured 1.0.
+                fill_placeholders = 1.0 not in valid_aspects
+                final_ratios = [avg_aspect if (r == 1.0 and fill_placeholders) else r
+                                for r in row_aspects]
+
+                # 1. Set Column Ratios
+                # Normalize so smallest is 1.0 for readability (optional, but cleaner)
+                min_r = min(final_ratios)
+                norm_col_ratios = [round(r / min_r, 2) for r in final_ratios]
             else:
+                # No images: equal columns, already normalised
                 final_ratios = [1.0] * col_count
-                
-            # 1. Set Column Ratios
-            # Normalize so smallest is 1.0 for readability (optional, but cleaner)
-            min_r = min(final_ratios)
-            norm_col_ratios = [round(r / min_r, 2) for r in final_ratios]
+                norm_col_ratios = [1.0] * col_count
             
             # 2. Calculate Natural Row Height Demand
             # H_demand ~ 1 / Sum(aspects)
@@ -383,25 +467,14 @@ class AutoLayout:
             total_natural_height += (num_rows - 1) * gap_mm
 
         # Account for label rows if label_placement is 'label_row_above'
-        label_row_above = getattr(project, "label_placement", "in_cell") == "label_row_above"
-        if label_row_above:
-            from src.model.layout_engine import LayoutEngine
-            custom_h = getattr(project, 'label_row_height', 0.0)
-            label_row_h = custom_h if custom_h > 0 else LayoutEngine._label_row_height_mm(project)
-
+        # (label strip height and labeled cells were resolved in step 1b)
+        if _label_row_above:
             # Find which row indices have numbering labels
-            labeled_cell_ids = set()
-            for t in project.text_items:
-                if t.scope == 'cell' and getattr(t, 'subtype', None) != 'corner' and t.parent_id:
-                    labeled_cell_ids.add(t.parent_id)
-            rows_with_labels = set()
-            for c in project.cells:
-                if c.id in labeled_cell_ids:
-                    rows_with_labels.add(c.row_index)
+            rows_with_labels = {c.row_index for c in project.cells if c.id in _labeled_cell_ids}
 
             num_label_rows = len(rows_with_labels)
             if num_label_rows > 0:
-                total_natural_height += num_label_rows * (label_row_h + gap_mm)
+                total_natural_height += num_label_rows * (_label_row_h + gap_mm)
 
         # Add margins
         optimal_page_height = total_natural_height + project.margin_top_mm + project.margin_bottom_mm
@@ -1,8 +1,9 @@
 import os
 import hashlib
 from collections import OrderedDict
+from functools import partial
 from PIL import Image
-from PyQt6.QtGui import QImage, QPixmap, QPainter
+from PyQt6.QtGui import QImage, QImageReader, QPixmap, QPainter
 from PyQt6.QtCore import QObject, pyqtSignal, QRunnable, QThreadPool, Qt, QSize
 from PyQt6.QtSvg import QSvgRenderer
 
@@ -10,6 +11,10 @@ from PyQt6.QtSvg import QSvgRenderer
 VECTOR_EXTENSIONS = {'.svg', '.pdf', '.eps'}
 # Raster formats handled by PIL
 RASTER_EXTENSIONS = {'.png', '.jpg', '.jpeg', '.tif', '.tiff', '.bmp', '.gif', '.webp'}
+# Load priority for thumbnails that are currently on screen (default is 0)
+VISIBLE_PRIORITY = 1
+# Default memory budget for cached thumbnails (Preferences → thumbnail_cache_mb)
+DEFAULT_CACHE_MB = 256
 
 def is_vector_image(path: str) -> bool:
     """Check if file is a supported vector format."""
@@ -28,9 +33,14 @@ class ThumbnailWorker(QRunnable):
         self.max_size = max_size
         self.callback = callback
         self.svg_override_bytes = svg_override_bytes
-        self.setAutoDelete(True)
+        # Owned from Python (ImageProxy._in_flight) rather than auto-deleted by
+        # the pool, so a queued worker can be tryTake()n without ever touching
+        # a runnable the pool has already freed.
+        self.setAutoDelete(False)
+        self.started = False
 
     def run(self):
+        self.started = True
         try:
             ext = os.path.splitext(self.path)[1].lower()
 
@@ -109,13 +119,32 @@ class ThumbnailWorker(QRunnable):
         pix = page.get_pixmap(matrix=matrix, alpha=True)
         doc.close()
         
-        # Convert to QImage
-        qimage = QImage(pix.samples, pix.width, pix.height, pix.stride, QImage.Format.Format_RGBA8888)
-        return qimage.copy()
+        # Deep copy: the QImage only wraps pix.samples, and PyQt keeps that
+        # buffer alive through this thread's Python wrapper, which is gone by
+        # the time the queued signal reaches the GUI thread.
+        return QImage(pix.samples, pix.width, pix.height, pix.stride, QImage.Format.Format_RGBA8888).copy()
 
     def _load_raster(self) -> QImage:
-        """Load raster image with PIL."""
+        """Load raster image, natively via Qt when possible, else with PIL."""
+        # Qt's decoders hand back an opaque JPEG as RGB32 (no alpha widening,
+        # no Python-side bytes copy) and scale during decode. EXIF orientation
+        # is left alone, matching the PIL path.
+        reader = QImageReader(self.path)
+        reader.setAutoTransform(False)
+        native = reader.size()
+        if native.isValid() and not native.isEmpty():
+            if max(native.width(), native.height()) > self.max_size:
+                reader.setScaledSize(native.scaled(self.max_size, self.max_size,
+                                                   Qt.AspectRatioMode.KeepAspectRatio))
+            qimage = reader.read()
+            if not qimage.isNull():
+                return qimage
+
         with Image.open(self.path) as img:
+            if img.format == 'JPEG':
+                # Let libjpeg DCT-scale (1/2..1/8) to just above the target
+                # instead of decoding every source pixel before LANCZOS.
+                img.draft(img.mode, (self.max_size, self.max_size))
             img.thumbnail((self.max_size, self.max_size), Image.Resampling.LANCZOS)
             
             # Convert to RGBA for Qt
@@ -123,22 +152,39 @@ class ThumbnailWorker(QRunnable):
                 img = img.convert('RGBA')
             
             data = img.tobytes("raw", "RGBA")
-            qimage = QImage(data, img.width, img.height, QImage.Format.Format_RGBA8888)
-            # Deep copy to ensure ownership
-            return qimage.copy()
+            # Deep copy: the image crosses to the GUI thread after `data` (kept
+            # alive only by this wrapper) is released.
+            return QImage(data, img.width, img.height, QImage.Format.Format_RGBA8888).copy()
 
 class ImageProxy(QObject):
     """
     Manages loading and caching of image thumbnails to ensure high performance.
-    Uses LRU cache with bounded size and thread pool for concurrent loading.
+    Uses an LRU cache bounded by item count and pixel-memory bytes, and a
+    thread pool for concurrent loading.
     """
     thumbnail_ready = pyqtSignal(str) # path
+    # Emitted from worker threads; the queued connection delivers it to
+    # _on_thumbnail_finished on the GUI thread, so only that thread ever
+    # touches _cache/_pending/_loading or creates QPixmaps.
+    _thumbnail_loaded = pyqtSignal(object, str, QImage) # worker, path, image (null on failure)
 
-    def __init__(self, max_cache_items=256):
+    def __init__(self, max_cache_items=256, max_cache_bytes=DEFAULT_CACHE_MB * 1024 * 1024):
         super().__init__()
         self._cache = OrderedDict() # path -> QPixmap, LRU ordered
         self._max_cache_items = max_cache_items
+        self._max_cache_bytes = max_cache_bytes
+        # Summed _pixmap_bytes of everything in _cache. Like _cache itself it
+        # is only read or updated on the GUI thread (_on_thumbnail_finished,
+        # _drop, _evict, clear_cache), so the budget cannot drift.
+        self._cache_bytes = 0
         self._loading = set() # paths currently loading
+        # Loads handed to the pool: path -> (worker, priority, bumped). While a
+        # worker is still queued, QThreadPool.tryTake lets bump() requeue it
+        # (at most once per load).
+        self._pending: dict[str, tuple] = {}
+        # Strong references to every worker the pool may still run; dropped in
+        # _on_thumbnail_finished (or when bump() takes it back).
+        self._in_flight: set = set()
         self._max_size = 1024 # Max dimension for thumbnail
         self._thread_pool = QThreadPool.globalInstance()
         self._thread_pool.setMaxThreadCount(4)  # Limit concurrent image loads
@@ -146,23 +192,56 @@ class ImageProxy(QObject):
         # Per-path subscriber callbacks: path -> list[callable]
         # Each callable is invoked (instead of the broadcast signal) when that path loads.
         self._subscribers: dict[str, list] = {}
+        self._thumbnail_loaded.connect(self._on_thumbnail_finished,
+                                       Qt.ConnectionType.QueuedConnection)
 
     def shutdown(self):
         # Wait for all workers to finish
         self._thread_pool.waitForDone(2000)
         self._loading.clear()
+        self._pending.clear()
+        if self._thread_pool.activeThreadCount() == 0:
+            self._in_flight.clear()
 
     def clear_cache(self):
         """Clear all cached thumbnails to force reload from disk."""
         self._cache.clear()
+        self._cache_bytes = 0
         self._loading.clear()
+        self._pending.clear()
 
     def invalidate(self, path: str):
         """Drop a single cached entry so the next get_pixmap reloads from disk."""
         if not path:
             return
-        self._cache.pop(path, None)
+        self._drop(path)
         self._loading.discard(path)
+        self._pending.pop(path, None)
+
+    def set_max_cache_bytes(self, max_bytes: int) -> None:
+        """Change the thumbnail memory budget, evicting LRU entries if now over it."""
+        self._max_cache_bytes = max_bytes
+        self._evict()
+
+    @staticmethod
+    def _pixmap_bytes(pixmap: QPixmap) -> int:
+        return pixmap.width() * pixmap.height() * max(1, pixmap.depth() // 8)
+
+    def _drop(self, path: str) -> None:
+        pixmap = self._cache.pop(path, None)
+        if pixmap is not None:
+            self._cache_bytes -= self._pixmap_bytes(pixmap)
+
+    def _evict(self) -> None:
+        """Drop least-recently-used entries until both cache limits hold.
+
+        The newest entry is always kept, even if it alone exceeds the byte
+        budget, so a just-finished load is never thrown away (and refetched).
+        """
+        while len(self._cache) > 1 and (len(self._cache) > self._max_cache_items
+                                        or self._cache_bytes > self._max_cache_bytes):
+            _path, pixmap = self._cache.popitem(last=False)
+            self._cache_bytes -= self._pixmap_bytes(pixmap)
 
     def subscribe(self, path: str, callback) -> None:
         """Register *callback* to be called when *path* finishes loading.
@@ -185,22 +264,24 @@ class ImageProxy(QObject):
     def set_svg_override(self, path: str, content: bytes):
         """Set pre-computed modified SVG bytes for a path and invalidate its cache entry."""
         self._svg_overrides[path] = content
-        self._cache.pop(path, None)
+        self._drop(path)
         self._loading.discard(path)
 
     def clear_svg_overrides(self):
         """Remove all SVG overrides and invalidate their cache entries."""
         for path in self._svg_overrides:
-            self._cache.pop(path, None)
+            self._drop(path)
             self._loading.discard(path)
         self._svg_overrides.clear()
 
-    def get_pixmap(self, path: str, callback=None) -> QPixmap:
+    def get_pixmap(self, path: str, callback=None, priority: int = 0) -> QPixmap:
         """
         Returns a cached QPixmap if available.
         If not, returns None and triggers background loading.
         When *callback* is provided it is registered as a subscriber so only
         that callback fires when the load completes (instead of a global broadcast).
+        Higher *priority* loads are started first; asking again for a queued
+        path with a higher priority moves it up instead of queueing it twice.
         Uses LRU eviction when cache is full.
         """
         if not path or not os.path.exists(path):
@@ -214,25 +295,54 @@ class ImageProxy(QObject):
             self.subscribe(path, callback)
 
         if path not in self._loading:
-            self._start_loading(path)
+            self._start_loading(path, priority)
+        else:
+            self.bump(path, priority)
 
         return None
 
-    def _start_loading(self, path):
+    def bump(self, path: str, priority: int) -> None:
+        """Requeue a not-yet-started load for *path* at a higher *priority*.
+
+        No-op if the path is not queued (cached, running, or never requested)
+        or was already bumped, so repeated paints of a loading cell cost one
+        dict lookup.
+        """
+        entry = self._pending.get(path)
+        if entry is None or entry[2] or priority <= entry[1]:
+            return
+        worker = entry[0]
+        if not worker.started and self._thread_pool.tryTake(worker):
+            self._in_flight.discard(worker)
+            self._start_loading(path, priority, bumped=True)
+        else:
+            self._pending[path] = (worker, entry[1], True)
+
+    def _start_loading(self, path, priority=0, bumped=False):
         self._loading.add(path)
         override = self._svg_overrides.get(path)
-        worker = ThumbnailWorker(path, self._max_size, self._on_thumbnail_finished, override)
-        self._thread_pool.start(worker)
+        worker = ThumbnailWorker(path, self._max_size, None, override)
+        worker.callback = partial(self._thumbnail_loaded.emit, worker)
+        self._in_flight.add(worker)
+        self._pending[path] = (worker, priority, bumped)
+        self._thread_pool.start(worker, priority)
 
-    def _on_thumbnail_finished(self, path, qimage):
+    def _on_thumbnail_finished(self, worker, path, qimage):
+        # GUI thread (queued from _thumbnail_loaded): the only place loads
+        # add to the cache and its byte budget.
+        self._in_flight.discard(worker)
+        worker.callback = None  # break the worker <-> partial cycle
+        entry = self._pending.get(path)
+        if entry is not None and entry[0] is worker:
+            del self._pending[path]
         if not qimage.isNull():
             pixmap = QPixmap.fromImage(qimage)
 
-            # Evict oldest item if cache is full (LRU)
-            if len(self._cache) >= self._max_cache_items:
-                self._cache.popitem(last=False)
-
+            # Insert as most recent, then evict oldest items past either limit (LRU)
+            self._drop(path)
             self._cache[path] = pixmap
+            self._cache_bytes += self._pixmap_bytes(pixmap)
+            self._evict()
 
         if path in self._loading:
             self._loading.remove(path)